@@ -41,31 +41,55 @@ def upgrade() -> None:
         sa.Column('icon', sa.String(length=50), nullable=True),
         sa.Column('is_system', sa.Boolean(), nullable=False, server_default='false'),
         sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE', deferrable=True, initially='DEFERRED'),
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('user_id', 'name', 'type', name='uq_user_category_name_type')
     )
+    # Seed system categories via bulk_insert so values travel as bound
+    # parameters (driver executemany fast path) instead of literal SQL
+    categories_tbl = sa.table(
+        'categories',
+        sa.column('user_id'),
+        sa.column('name'),
+        sa.column('type'),
+        sa.column('color'),
+        sa.column('icon'),
+        sa.column('is_system'),
+    )
+    # The seed runs in an autocommit block so large seed batches commit
+    # independently instead of accumulating in the migration transaction
+    with op.get_context().autocommit_block():
+        op.bulk_insert(
+            categories_tbl,
+            [
+                {'user_id': None, 'name': name, 'type': type_, 'color': color, 'icon': icon, 'is_system': True}
+                for name, type_, color, icon in [
+                    ('Combustível', 'expense', '#F59E0B', 'gas-station'),
+                    ('Manutenção do Veículo', 'expense', '#EF4444', 'car-wrench'),
+                    ('Pedágios', 'expense', '#6366F1', 'road'),
+                    ('Estacionamento', 'expense', '#8B5CF6', 'parking'),
+                    ('Seguro do Veículo', 'expense', '#EC4899', 'shield-car'),
+                    ('IPVA', 'expense', '#14B8A6', 'file-document'),
+                    ('Alimentação', 'expense', '#10B981', 'food'),
+                    ('Outros', 'expense', '#6B7280', 'dots-horizontal'),
+                    ('Corridas', 'income', '#22C55E', 'car'),
+                    ('Entregas', 'income', '#3B82F6', 'package-variant'),
+                    ('Gorjetas', 'income', '#FBBF24', 'cash'),
+                    ('Bônus', 'income', '#A855F7', 'star'),
+                    ('Outros', 'income', '#6B7280', 'cash-plus'),
+                ]
+            ],
+            multiinsert=True,
+        )
+
+    # Indexes are created after the seed insert so the rows above don't pay
+    # per-row B-tree maintenance on three indexes
     op.create_index(op.f('ix_categories_id'), 'categories', ['id'], unique=False)
     op.create_index(op.f('ix_categories_user_id'), 'categories', ['user_id'], unique=False)
     op.create_index('ix_categories_type_system', 'categories', ['type', 'is_system'], unique=False)
-    
-    # Seed system categories
-    op.execute("""
-        INSERT INTO categories (user_id, name, type, color, icon, is_system) VALUES
-        (NULL, 'Combustível', 'expense', '#F59E0B', 'gas-station', true),
-        (NULL, 'Manutenção do Veículo', 'expense', '#EF4444', 'car-wrench', true),
-        (NULL, 'Pedágios', 'expense', '#6366F1', 'road', true),
-        (NULL, 'Estacionamento', 'expense', '#8B5CF6', 'parking', true),
-        (NULL, 'Seguro do Veículo', 'expense', '#EC4899', 'shield-car', true),
-        (NULL, 'IPVA', 'expense', '#14B8A6', 'file-document', true),
-        (NULL, 'Alimentação', 'expense', '#10B981', 'food', true),
-        (NULL, 'Outros', 'expense', '#6B7280', 'dots-horizontal', true),
-        (NULL, 'Corridas', 'income', '#22C55E', 'car', true),
-        (NULL, 'Entregas', 'income', '#3B82F6', 'package-variant', true),
-        (NULL, 'Gorjetas', 'income', '#FBBF24', 'cash', true),
-        (NULL, 'Bônus', 'income', '#A855F7', 'star', true),
-        (NULL, 'Outros', 'income', '#6B7280', 'cash-plus', true)
-    """)
+    # Refresh planner statistics immediately so the first queries after
+    # deploy use the indexes instead of waiting for autovacuum
+    op.execute("ANALYZE categories")
 
 
 def downgrade() -> None:
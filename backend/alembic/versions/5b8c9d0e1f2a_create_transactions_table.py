@@ -52,6 +52,8 @@ def upgrade() -> None:
     op.create_index(op.f('ix_transactions_category_id'), 'transactions', ['category_id'], unique=False)
     op.create_index('ix_transactions_user_date', 'transactions', ['user_id', 'transaction_date'], unique=False)
     op.create_index('ix_transactions_user_type_date', 'transactions', ['user_id', 'type', 'transaction_date'], unique=False)
+    # Seed planner statistics up front rather than waiting for autovacuum
+    op.execute("ANALYZE transactions")
 
 
 def downgrade() -> None:
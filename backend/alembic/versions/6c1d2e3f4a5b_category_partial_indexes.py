@@ -0,0 +1,39 @@
+"""category partial indexes
+
+Revision ID: 6c1d2e3f4a5b
+Revises: 5b8c9d0e1f2a
+Create Date: 2026-01-02 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c1d2e3f4a5b'
+down_revision: Union[str, Sequence[str], None] = '5b8c9d0e1f2a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace the full user_id index with partial indexes for the hot OR-predicate."""
+    # Category reads filter on "user_id = ? OR is_system". The full user_id
+    # index is useless for the system arm (user_id IS NULL there); a partial
+    # index per arm lets the planner combine two small index scans instead of
+    # bitmap-unioning a non-selective index.
+    op.drop_index(op.f('ix_categories_user_id'), table_name='categories')
+    op.execute(
+        "CREATE INDEX ix_categories_user_id_notnull ON categories (user_id) "
+        "WHERE user_id IS NOT NULL"
+    )
+    op.execute("CREATE INDEX ix_categories_system ON categories (id) WHERE is_system")
+
+
+def downgrade() -> None:
+    """Restore the full user_id index."""
+    op.execute("DROP INDEX IF EXISTS ix_categories_system")
+    op.execute("DROP INDEX IF EXISTS ix_categories_user_id_notnull")
+    op.create_index(op.f('ix_categories_user_id'), 'categories', ['user_id'], unique=False)
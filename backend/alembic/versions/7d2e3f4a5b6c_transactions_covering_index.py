@@ -0,0 +1,43 @@
+"""transactions covering index
+
+Revision ID: 7d2e3f4a5b6c
+Revises: 6c1d2e3f4a5b
+Create Date: 2026-01-02 09:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2e3f4a5b6c'
+down_revision: Union[str, Sequence[str], None] = '6c1d2e3f4a5b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Make the analytics index covering so aggregates run index-only."""
+    # Monthly summaries and the category breakdown aggregate amount and
+    # category_id over (user_id, type, transaction_date) ranges. Including
+    # those payload columns lets Postgres answer the aggregates from the
+    # index without a heap fetch per row.
+    op.drop_index('ix_transactions_user_type_date', table_name='transactions')
+    op.execute(
+        "CREATE INDEX ix_transactions_user_type_date ON transactions "
+        "(user_id, type, transaction_date) INCLUDE (amount, category_id)"
+    )
+    op.execute("ANALYZE transactions")
+
+
+def downgrade() -> None:
+    """Restore the plain composite index."""
+    op.drop_index('ix_transactions_user_type_date', table_name='transactions')
+    op.create_index(
+        'ix_transactions_user_type_date',
+        'transactions',
+        ['user_id', 'type', 'transaction_date'],
+        unique=False,
+    )
@@ -0,0 +1,52 @@
+"""check constrained type columns
+
+Revision ID: 8e3f4a5b6c7d
+Revises: 7d2e3f4a5b6c
+Create Date: 2026-01-02 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e3f4a5b6c7d'
+down_revision: Union[str, Sequence[str], None] = '7d2e3f4a5b6c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert the two native enum type columns to CHECK-constrained varchar."""
+    # categorytype and transactiontype are near-identical ('income',
+    # 'expense') native enums created per table. Plain varchar + CHECK keeps
+    # index behaviour, avoids the DO/exception enum-creation blocks, and
+    # turns future value additions into a trivial constraint swap instead of
+    # a locking ALTER TYPE.
+    op.execute("ALTER TABLE categories ALTER COLUMN type TYPE varchar(7) USING type::text")
+    op.create_check_constraint(
+        'ck_categories_type', 'categories', "type IN ('income', 'expense')"
+    )
+    op.execute("ALTER TABLE transactions ALTER COLUMN type TYPE varchar(7) USING type::text")
+    op.create_check_constraint(
+        'ck_transactions_type', 'transactions', "type IN ('income', 'expense')"
+    )
+    op.execute("DROP TYPE IF EXISTS categorytype")
+    op.execute("DROP TYPE IF EXISTS transactiontype")
+
+
+def downgrade() -> None:
+    """Restore the per-table native enum types."""
+    op.execute("CREATE TYPE categorytype AS ENUM ('income', 'expense')")
+    op.execute("CREATE TYPE transactiontype AS ENUM ('income', 'expense')")
+    op.drop_constraint('ck_categories_type', 'categories', type_='check')
+    op.execute(
+        "ALTER TABLE categories ALTER COLUMN type TYPE categorytype USING type::categorytype"
+    )
+    op.drop_constraint('ck_transactions_type', 'transactions', type_='check')
+    op.execute(
+        "ALTER TABLE transactions ALTER COLUMN type TYPE transactiontype "
+        "USING type::transactiontype"
+    )
@@ -0,0 +1,43 @@
+"""transactions list index
+
+Revision ID: 9a4b5c6d7e8f
+Revises: 8e3f4a5b6c7d
+Create Date: 2026-01-02 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4b5c6d7e8f'
+down_revision: Union[str, Sequence[str], None] = '8e3f4a5b6c7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Rebuild the user/date index to match the list endpoint's scan order."""
+    # The list endpoint filters by user, orders newest-first and optionally
+    # filters on type. Storing transaction_date DESC with type appended lets
+    # the planner stream rows in output order and push the LIMIT into the
+    # index scan instead of sorting the whole match set.
+    op.drop_index('ix_transactions_user_date', table_name='transactions')
+    op.execute(
+        "CREATE INDEX ix_transactions_user_date ON transactions "
+        "(user_id, transaction_date DESC, type)"
+    )
+    op.execute("ANALYZE transactions")
+
+
+def downgrade() -> None:
+    """Restore the plain ascending (user_id, transaction_date) index."""
+    op.drop_index('ix_transactions_user_date', table_name='transactions')
+    op.create_index(
+        'ix_transactions_user_date',
+        'transactions',
+        ['user_id', 'transaction_date'],
+        unique=False,
+    )
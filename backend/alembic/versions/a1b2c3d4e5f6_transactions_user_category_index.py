@@ -0,0 +1,39 @@
+"""transactions user category index
+
+Revision ID: a1b2c3d4e5f6
+Revises: 9a4b5c6d7e8f
+Create Date: 2026-01-02 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1b2c3d4e5f6'
+down_revision: Union[str, Sequence[str], None] = '9a4b5c6d7e8f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the composite index for per-user category filtering."""
+    # get_by_category and the category_id list filter match (user_id,
+    # category_id); the lone category_id index forced a filter step over
+    # every user's rows. The single-column index stays for the FK's
+    # ON DELETE SET NULL scans. (user_id, type) needs no new index — it is
+    # a prefix of ix_transactions_user_type_date.
+    op.create_index(
+        'ix_transactions_user_category',
+        'transactions',
+        ['user_id', 'category_id'],
+        unique=False,
+    )
+    op.execute("ANALYZE transactions")
+
+
+def downgrade() -> None:
+    """Drop the composite user/category index."""
+    op.drop_index('ix_transactions_user_category', table_name='transactions')
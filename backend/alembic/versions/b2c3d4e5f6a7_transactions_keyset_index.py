@@ -0,0 +1,42 @@
+"""transactions keyset index
+
+Revision ID: b2c3d4e5f6a7
+Revises: a1b2c3d4e5f6
+Create Date: 2026-01-02 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2c3d4e5f6a7'
+down_revision: Union[str, Sequence[str], None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Append id DESC to the list index for keyset pagination."""
+    # Keyset pagination seeks on (transaction_date, id) < (cursor_date,
+    # cursor_id); with id stored right after the date column the row-value
+    # comparison resolves to a single index seek and ties on
+    # transaction_date stay in a deterministic order. type stays appended
+    # for the list endpoint's optional filter.
+    op.drop_index('ix_transactions_user_date', table_name='transactions')
+    op.execute(
+        "CREATE INDEX ix_transactions_user_date ON transactions "
+        "(user_id, transaction_date DESC, id DESC, type)"
+    )
+    op.execute("ANALYZE transactions")
+
+
+def downgrade() -> None:
+    """Restore the index without the id tie-breaker."""
+    op.drop_index('ix_transactions_user_date', table_name='transactions')
+    op.execute(
+        "CREATE INDEX ix_transactions_user_date ON transactions "
+        "(user_id, transaction_date DESC, type)"
+    )
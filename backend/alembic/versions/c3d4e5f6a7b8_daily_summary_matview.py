@@ -0,0 +1,49 @@
+"""daily summary matview
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6a7
+Create Date: 2026-01-02 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3d4e5f6a7b8'
+down_revision: Union[str, Sequence[str], None] = 'b2c3d4e5f6a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the pre-aggregated per-user daily summary view."""
+    # Pre-aggregates one row per (user, day, type, category). category_id
+    # is coalesced to 0 for uncategorized rows because REFRESH ...
+    # CONCURRENTLY needs a plain unique index covering every row, and
+    # NULLs never compare equal in one.
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_daily_summary AS
+        SELECT
+            user_id,
+            transaction_date::date AS day,
+            type,
+            COALESCE(category_id, 0) AS category_id,
+            SUM(amount) AS total,
+            COUNT(*) AS count
+        FROM transactions
+        GROUP BY 1, 2, 3, 4
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ix_mv_daily_summary_key "
+        "ON mv_daily_summary (user_id, day, type, category_id)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the daily summary view."""
+    op.execute("DROP MATERIALIZED VIEW mv_daily_summary")
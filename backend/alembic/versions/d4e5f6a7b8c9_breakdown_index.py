@@ -0,0 +1,46 @@
+"""breakdown index
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-01-02 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, Sequence[str], None] = 'c3d4e5f6a7b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Append transaction_date to the user/category index."""
+    # The category breakdown filters on (user_id, category_id) plus an
+    # optional date range; with transaction_date appended the range is
+    # resolved inside the index scan instead of via a per-row filter.
+    # ix_transactions_user_type_date already covers the
+    # (user_id, type, transaction_date) predicate set.
+    op.drop_index('ix_transactions_user_category', table_name='transactions')
+    op.create_index(
+        'ix_transactions_user_category',
+        'transactions',
+        ['user_id', 'category_id', 'transaction_date'],
+        unique=False,
+    )
+    op.execute("ANALYZE transactions")
+
+
+def downgrade() -> None:
+    """Restore the two-column user/category index."""
+    op.drop_index('ix_transactions_user_category', table_name='transactions')
+    op.create_index(
+        'ix_transactions_user_category',
+        'transactions',
+        ['user_id', 'category_id'],
+        unique=False,
+    )
@@ -0,0 +1,46 @@
+"""analytics partial indexes
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-01-02 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, Sequence[str], None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add partial indexes matching the analytics predicates."""
+    # Each index holds only the rows its analytics query touches, so it
+    # stays small and cache-resident: income/expense back the FILTER
+    # aggregates over [start, end) ranges, and the fuel index covers the
+    # daily summary's hardcoded fuel category.
+    op.execute(
+        "CREATE INDEX ix_tx_income ON transactions (user_id, transaction_date) "
+        "WHERE type = 'income'"
+    )
+    op.execute(
+        "CREATE INDEX ix_tx_expense ON transactions (user_id, transaction_date) "
+        "WHERE type = 'expense'"
+    )
+    op.execute(
+        "CREATE INDEX ix_tx_fuel ON transactions (user_id, transaction_date) "
+        "WHERE type = 'expense' AND category_id = 1"
+    )
+    op.execute("ANALYZE transactions")
+
+
+def downgrade() -> None:
+    """Drop the analytics partial indexes."""
+    op.drop_index('ix_tx_fuel', table_name='transactions')
+    op.drop_index('ix_tx_expense', table_name='transactions')
+    op.drop_index('ix_tx_income', table_name='transactions')
@@ -1,83 +1,167 @@
+import time
+from dataclasses import dataclass
 from typing import Annotated
 
+import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.core.database import get_db
 from app.repositories.user_repository import user_repository
 from app.models.user import User
-from app.schemas.token import TokenPayload
 
-settings = get_settings()
-security = HTTPBearer()
+security = HTTPBearer(auto_error=True, bearerFormat="JWT")
+
+# Settings attributes are resolved once at import; the request hot path only
+# touches module-level constants
+_settings = get_settings()
+_DECODE_KEY = _settings.SECRET_KEY.encode()
+_ALGORITHMS = [_settings.ALGORITHM]
+
+# Shared 401 raised on any validation failure; FastAPI doesn't mutate the
+# exception object, so one instance can serve every request
+_CREDENTIALS_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
 
 __all__ = ["get_db", "get_current_user", "get_current_active_user"]
 
 
+@dataclass
+class _CachedAuth:
+    """Cached result of a successful token validation."""
+
+    user: User
+    exp: float
+
+
+# Per-worker cache of validated tokens. A hit skips both the HMAC
+# verification and the user SELECT for repeat requests with the same token.
+# The event loop is single-threaded and there are no awaits between cache
+# reads and writes, so plain dict operations are safe without a lock.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def drop_token(token: str) -> None:
+    """Remove a token from the auth cache (e.g. on logout)."""
+    _token_cache.pop(token, None)
+
+
+def drop_user(user_id: int) -> None:
+    """
+    Evict every cached auth entry for a user.
+
+    Call after profile mutations (email, password, is_active) so the next
+    authenticated request re-reads the row instead of serving the stale
+    cached User for up to the cache TTL.
+    """
+    stale = [token for token, entry in _token_cache.items() if entry.user.id == user_id]
+    for token in stale:
+        _token_cache.pop(token, None)
+
+
+def _decode_token(token: str) -> tuple[int, float | None]:
+    """
+    Verify a JWT and extract the subject.
+
+    Args:
+        token: Raw bearer token
+
+    Returns:
+        Tuple of (user id, token expiry timestamp)
+
+    Raises:
+        HTTPException: If the token is invalid
+    """
+    try:
+        payload = jwt.decode(
+            token,
+            _DECODE_KEY,
+            algorithms=_ALGORITHMS,
+            options={"require": ["exp", "sub"]},
+        )
+        return int(payload["sub"]), payload.get("exp")
+    except jwt.PyJWTError:
+        raise _CREDENTIALS_EXC
+    except ValueError:
+        raise _CREDENTIALS_EXC
+
+
+def _cache_token(token: str, user: User, exp: float | None) -> None:
+    """Store a validated token/user pair in the auth cache."""
+    if exp is not None:
+        _token_cache[token] = _CachedAuth(user=user, exp=float(exp))
+
+
 async def get_current_user(
     db: Annotated[AsyncSession, Depends(get_db)],
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
 ) -> User:
     """
     Validate JWT token and return current user.
-    
+
+    Does not require the user to be active; use this for admin paths that
+    need to see inactive accounts.
+
     Args:
         db: Database session
         credentials: HTTP Bearer token from Authorization header
-        
+
     Returns:
         Current authenticated user
-        
+
     Raises:
         HTTPException: If token is invalid or user not found
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    
-    try:
-        token = credentials.credentials
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: str | None = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-        token_data = TokenPayload(sub=int(user_id))
-    except JWTError:
-        raise credentials_exception
-    except ValueError:
-        raise credentials_exception
-    
-    user = await user_repository.get_by_id(db, id=token_data.sub)
+    token = credentials.credentials
+    cached = _token_cache.get(token)
+    if cached is not None and cached.exp > time.time():
+        return cached.user
+
+    user_id, exp = _decode_token(token)
+    user = await user_repository.get_by_id(db, id=user_id)
     if user is None:
-        raise credentials_exception
-    
+        raise _CREDENTIALS_EXC
+
+    _cache_token(token, user, exp)
     return user
 
 
 async def get_current_active_user(
-    current_user: Annotated[User, Depends(get_current_user)]
+    db: Annotated[AsyncSession, Depends(get_db)],
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
 ) -> User:
     """
-    Get current active user.
-    
+    Validate JWT token and return current active user.
+
+    The is_active filter is pushed into the SQL query, so this resolves in
+    a single round-trip instead of fetching the user and checking the flag
+    in Python.
+
     Args:
-        current_user: Current authenticated user
-        
+        db: Database session
+        credentials: HTTP Bearer token from Authorization header
+
     Returns:
         Current user if active
-        
+
     Raises:
-        HTTPException: If user is inactive
+        HTTPException: If token is invalid, user not found, or user inactive
     """
-    if not current_user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Inactive user"
-        )
-    return current_user
+    token = credentials.credentials
+    cached = _token_cache.get(token)
+    if cached is not None and cached.exp > time.time() and cached.user.is_active:
+        return cached.user
 
+    user_id, exp = _decode_token(token)
+    user = await user_repository.get_active_by_id(db, id=user_id)
+    if user is None:
+        raise _CREDENTIALS_EXC
+
+    _cache_token(token, user, exp)
+    return user
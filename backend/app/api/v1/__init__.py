@@ -1,21 +1,22 @@
-from fastapi import APIRouter
+import importlib
 
-from app.api.v1.endpoints import auth, users, transactions, categories, analytics
+from fastapi import APIRouter
 
+# The orjson default response class is applied app-wide in app.main; the
+# router inherits it, so no per-router override is needed here
 api_router = APIRouter()
 
-# Include authentication endpoints
-api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
-
-# Include user management endpoints
-api_router.include_router(users.router, prefix="/users", tags=["users"])
-
-# Include transaction endpoints
-api_router.include_router(transactions.router, prefix="/transactions", tags=["transactions"])
-
-# Include category endpoints
-api_router.include_router(categories.router, prefix="/categories", tags=["categories"])
-
-# Include analytics endpoints
-api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
-
+# Endpoint modules are resolved through importlib instead of one eager
+# multi-name import, keeping the module list declarative so deferred or
+# partial loading stays a one-line change
+_ENDPOINT_MODULES = [
+    ("auth", "/auth", "authentication"),
+    ("users", "/users", "users"),
+    ("transactions", "/transactions", "transactions"),
+    ("categories", "/categories", "categories"),
+    ("analytics", "/analytics", "analytics"),
+]
+
+for _name, _prefix, _tag in _ENDPOINT_MODULES:
+    _module = importlib.import_module(f"app.api.v1.endpoints.{_name}")
+    api_router.include_router(_module.router, prefix=_prefix, tags=[_tag])
@@ -1,12 +1,14 @@
 from typing import Annotated
-from datetime import datetime, date
+from datetime import date as _date, datetime
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_user, get_db
+from app.core.responses import conditional_response
 from app.models.user import User
 from app.models.transaction import TransactionType
+from app.repositories.transaction_repository import transaction_repository
 from app.services.analytics_service import analytics_service
 
 router = APIRouter()
@@ -14,9 +16,13 @@ router = APIRouter()
 
 @router.get("/monthly")
 async def get_monthly_summary(
+    request: Request,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-    year: int = Query(..., description="Year (e.g., 2025)"),
+    # datetime() only accepts years 1-9999; bound here so out-of-range
+    # years get a 422 instead of a ValueError mid-handler
+    year: int = Query(..., ge=1, le=9999, description="Year (e.g., 2025)"),
     month: int = Query(..., ge=1, le=12, description="Month (1-12)"),
 ):
     """
@@ -36,6 +42,9 @@ async def get_monthly_summary(
     - **balance**: Net balance (income - expenses)
     - **total_transactions**: Total number of transactions
     """
+    change_marker = await transaction_repository.get_change_marker(db, current_user.id)
+    if not_modified := conditional_response(request, response, change_marker):
+        return not_modified
     return await analytics_service.get_monthly_summary(db, current_user.id, year, month)
 
 
@@ -43,17 +52,19 @@ async def get_monthly_summary(
 async def get_category_breakdown(
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-    type: str | None = Query(None, description="Filter by transaction type (income or expense)"),
+    type: TransactionType | None = Query(None, description="Filter by transaction type (income or expense)"),
     start_date: str | None = Query(None, description="Start date (ISO format)"),
     end_date: str | None = Query(None, description="End date (ISO format)"),
+    limit: int | None = Query(None, ge=1, le=100, description="Return only the top N categories"),
 ):
     """
     Get spending/income breakdown by category.
-    
+
     Optional query parameters:
     - **type**: Filter by transaction type (income or expense)
     - **start_date**: Filter by start date (ISO format: YYYY-MM-DD)
     - **end_date**: Filter by end date (ISO format: YYYY-MM-DD)
+    - **limit**: Return only the top N categories by total
     
     Returns list of categories with:
     - **category_id**: Category ID
@@ -66,18 +77,19 @@ async def get_category_breakdown(
     
     Results are ordered by total amount (highest first).
     """
-    # Parse optional filters
-    transaction_type = TransactionType(type) if type else None
+    # Parse optional filters; type is validated by FastAPI as an enum member
     start = datetime.fromisoformat(start_date) if start_date else None
     end = datetime.fromisoformat(end_date) if end_date else None
     
     return await analytics_service.get_category_breakdown(
-        db, current_user.id, transaction_type, start, end
+        db, current_user.id, type, start, end, limit=limit
     )
 
 
 @router.get("/fuel")
 async def get_fuel_analytics(
+    request: Request,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
     start_date: str | None = Query(None, description="Start date (ISO format)"),
@@ -101,11 +113,16 @@ async def get_fuel_analytics(
     start = datetime.fromisoformat(start_date) if start_date else None
     end = datetime.fromisoformat(end_date) if end_date else None
     
+    change_marker = await transaction_repository.get_change_marker(db, current_user.id)
+    if not_modified := conditional_response(request, response, change_marker):
+        return not_modified
     return await analytics_service.get_fuel_analytics(db, current_user.id, start, end)
 
 
 @router.get("/summary")
 async def get_overall_summary(
+    request: Request,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
@@ -120,11 +137,16 @@ async def get_overall_summary(
     Note: This endpoint is also available at /transactions/summary
     """
     from app.services.transaction_service import transaction_service
+    change_marker = await transaction_repository.get_change_marker(db, current_user.id)
+    if not_modified := conditional_response(request, response, change_marker):
+        return not_modified
     return await transaction_service.get_summary(db, current_user.id)
 
 
 @router.get("/daily")
 async def get_daily_summary(
+    request: Request,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
     date: str | None = Query(None, description="Date (ISO format: YYYY-MM-DD). Defaults to today."),
@@ -144,8 +166,12 @@ async def get_daily_summary(
     - **balance**: Net balance for the day (income - expenses)
     - **total_transactions**: Total number of transactions for the day
     """
-    # Parse date or use today
-    target_date = datetime.fromisoformat(date).date() if date else datetime.now().date()
-    
+    # Parse date or use today; date.fromisoformat skips the full datetime
+    # parse + .date() truncation for pure-date input
+    target_date = _date.fromisoformat(date) if date else _date.today()
+
+    change_marker = await transaction_repository.get_change_marker(db, current_user.id)
+    if not_modified := conditional_response(request, response, change_marker):
+        return not_modified
     return await analytics_service.get_daily_summary(db, current_user.id, target_date)
 
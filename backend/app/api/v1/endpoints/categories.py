@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_user, get_db
+from app.core.cache import invalidate_category
 from app.models.user import User
 from app.models.category import CategoryType
 from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryResponse
@@ -16,7 +17,7 @@ router = APIRouter()
 async def list_categories(
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-    type: str | None = None,
+    type: CategoryType | None = None,
 ):
     """
     List all categories available to the current user.
@@ -27,8 +28,7 @@ async def list_categories(
     - **type**: Filter by category type (income or expense)
     """
     if type:
-        category_type = CategoryType(type)
-        return await category_repository.get_by_type(db, current_user.id, category_type)
+        return await category_repository.get_by_type(db, current_user.id, type)
     else:
         return await category_repository.get_user_categories(db, current_user.id)
 
@@ -137,7 +137,9 @@ async def update_category(
                 detail="Category with this name and type already exists"
             )
     
-    return await category_repository.update(db, category_id, category_data)
+    updated = await category_repository.update(db, category_id, category_data)
+    invalidate_category(category_id)
+    return updated
 
 
 @router.delete("/{category_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -175,5 +177,6 @@ async def delete_category(
         )
     
     await category_repository.delete(db, category_id)
+    invalidate_category(category_id)
     return None
 
@@ -1,16 +1,26 @@
-from typing import Annotated
-
-from fastapi import APIRouter, Depends, status
+from typing import Annotated, Any, AsyncIterator
+from datetime import datetime
+from decimal import Decimal
+
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_active_user, get_db
+from app.core.database import AsyncSessionLocal
+from app.core.responses import conditional_response
 from app.models.user import User
+from app.models.transaction import Transaction, TransactionType
+from app.repositories.transaction_repository import transaction_repository
 from app.schemas.transaction import (
     TransactionCreate,
     TransactionUpdate,
     TransactionResponse,
     TransactionFilter,
 )
+from app.services.analytics_service import refresh_daily_summary_view
 from app.services.transaction_service import transaction_service
 
 router = APIRouter()
@@ -19,6 +29,7 @@ router = APIRouter()
 @router.post("/", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
 async def create_transaction(
     transaction_data: TransactionCreate,
+    background_tasks: BackgroundTasks,
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
@@ -33,23 +44,31 @@ async def create_transaction(
     
     Returns the created transaction.
     """
-    return await transaction_service.create_transaction(db, transaction_data, current_user.id)
+    transaction = await transaction_service.create_transaction(
+        db, transaction_data, current_user.id
+    )
+    # Refresh the reporting view after the response goes out; the call is
+    # debounced so bursts of writes trigger at most one refresh per window
+    background_tasks.add_task(refresh_daily_summary_view)
+    return transaction
 
 
 @router.get("/", response_model=list[TransactionResponse])
 async def list_transactions(
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
-    type: str | None = None,
+    type: TransactionType | None = None,
     category_id: int | None = None,
     start_date: str | None = None,
     end_date: str | None = None,
     skip: int = 0,
     limit: int = 50,
+    after_date: str | None = None,
+    after_id: int | None = None,
 ):
     """
     List transactions for the current user.
-    
+
     Optional filters:
     - **type**: Filter by transaction type (income or expense)
     - **category_id**: Filter by category
@@ -57,20 +76,22 @@ async def list_transactions(
     - **end_date**: Filter by end date (ISO format)
     - **skip**: Number of records to skip (pagination)
     - **limit**: Maximum number of records to return (max 100)
-    
+    - **after_date** / **after_id**: Keyset cursor — pass the last row's
+      transaction_date and id to fetch the next page; cheaper than skip
+      for deep pagination
+
     Returns list of transactions ordered by date (newest first).
     """
-    from datetime import datetime
-    from app.models.transaction import TransactionType
-    
-    # Parse filters
+    # Parse filters; type is validated by FastAPI as an enum member
     filters = TransactionFilter(
-        type=TransactionType(type) if type else None,
+        type=type,
         category_id=category_id,
         start_date=datetime.fromisoformat(start_date) if start_date else None,
         end_date=datetime.fromisoformat(end_date) if end_date else None,
         skip=skip,
         limit=min(limit, 100),
+        after_date=datetime.fromisoformat(after_date) if after_date else None,
+        after_id=after_id,
     )
     
     return await transaction_service.get_user_transactions(db, current_user.id, filters)
@@ -78,20 +99,67 @@ async def list_transactions(
 
 @router.get("/summary")
 async def get_transaction_summary(
+    request: Request,
+    response: Response,
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """
     Get financial summary for the current user.
-    
+
     Returns:
     - **total_income**: Total income
     - **total_expenses**: Total expenses
     - **balance**: Current balance (income - expenses)
     """
+    change_marker = await transaction_repository.get_change_marker(db, current_user.id)
+    if not_modified := conditional_response(request, response, change_marker):
+        return not_modified
     return await transaction_service.get_summary(db, current_user.id)
 
 
+@router.get("/export")
+async def export_transactions(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+):
+    """
+    Export all transactions for the current user as NDJSON.
+
+    Streams one JSON object per line, ordered by date (newest first).
+    Rows are serialized straight from the database cursor, so memory
+    stays flat regardless of how many transactions the user has.
+    """
+    user_id = current_user.id
+
+    def _encode_default(obj: Any) -> Any:
+        if isinstance(obj, Decimal):
+            return float(obj)
+        raise TypeError
+
+    async def generate() -> AsyncIterator[bytes]:
+        # Dedicated session: the request-scoped one is released when the
+        # handler returns, before the response body streams
+        async with AsyncSessionLocal() as session:
+            result = await session.stream(
+                select(
+                    Transaction.id,
+                    Transaction.type,
+                    Transaction.amount,
+                    Transaction.description,
+                    Transaction.transaction_date,
+                    Transaction.category_id,
+                    Transaction.created_at,
+                    Transaction.updated_at,
+                )
+                .where(Transaction.user_id == user_id)
+                .order_by(Transaction.transaction_date.desc())
+            )
+            async for row in result:
+                yield orjson.dumps(dict(row._mapping), default=_encode_default) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/{transaction_id}", response_model=TransactionResponse)
 async def get_transaction(
     transaction_id: int,
@@ -110,31 +178,36 @@ async def get_transaction(
 async def update_transaction(
     transaction_id: int,
     transaction_data: TransactionUpdate,
+    background_tasks: BackgroundTasks,
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """
     Update a transaction.
-    
+
     All fields are optional. Only provided fields will be updated.
     Transaction must belong to the current user.
     """
-    return await transaction_service.update_transaction(
+    transaction = await transaction_service.update_transaction(
         db, transaction_id, transaction_data, current_user.id
     )
+    background_tasks.add_task(refresh_daily_summary_view)
+    return transaction
 
 
 @router.delete("/{transaction_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_transaction(
     transaction_id: int,
+    background_tasks: BackgroundTasks,
     current_user: Annotated[User, Depends(get_current_active_user)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ):
     """
     Delete a transaction.
-    
+
     Transaction must belong to the current user.
     """
     await transaction_service.delete_transaction(db, transaction_id, current_user.id)
+    background_tasks.add_task(refresh_daily_summary_view)
     return None
 
@@ -1,9 +1,10 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_active_user, get_db
+from app.api.deps import drop_user, get_current_active_user, get_db
+from app.core.responses import conditional_response
 from app.repositories.user_repository import user_repository
 from app.models.user import User
 from app.schemas.user import UserResponse, UserUpdate
@@ -13,13 +14,21 @@ router = APIRouter()
 
 @router.get("/me", response_model=UserResponse)
 async def read_current_user(
-    current_user: Annotated[User, Depends(get_current_active_user)]
-) -> User:
+    request: Request,
+    response: Response,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+):
     """
     Get current user profile.
-    
+
     Requires authentication.
     """
+    # Profile only changes via PUT /me, which bumps updated_at; the id
+    # fills the marker's count slot, since a single-row resource has no
+    # deletion case to track
+    marker = (current_user.updated_at, current_user.id)
+    if not_modified := conditional_response(request, response, marker):
+        return not_modified
     return current_user
 
 
@@ -53,22 +62,29 @@ async def update_current_user(
                 detail="Not authorized to modify active status"
             )
     
-    # Check email uniqueness if email is being updated
+    # Email changes go through the guarded update: the uniqueness check is
+    # folded into the UPDATE itself, saving a round trip and closing the
+    # race with a concurrent signup. current_user was just authenticated,
+    # so a None result can only mean the email is taken.
     if user_update.email and user_update.email != current_user.email:
-        existing_user = await user_repository.get_by_email(db, email=user_update.email)
-        if existing_user:
+        updated_user = await user_repository.update_if_email_free(
+            db, id=current_user.id, obj_in=user_update
+        )
+        if not updated_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered"
             )
-    
-    updated_user = await user_repository.update(db, id=current_user.id, obj_in=user_update)
-    if not updated_user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
+    else:
+        updated_user = await user_repository.update(db, id=current_user.id, obj_in=user_update)
+        if not updated_user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found"
+            )
+
+    # Evict cached auth entries so subsequent requests see the new profile
+    drop_user(current_user.id)
     return updated_user
 
 
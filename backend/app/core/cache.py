@@ -0,0 +1,64 @@
+"""In-process TTL caches for hot read paths.
+
+The deployment runs without a shared cache service, so these are per-worker
+cachetools caches: reads are nanosecond dict lookups, entries expire on TTL,
+and write paths invalidate explicitly. Everything here is keyed by user_id —
+never cache cross-user values under a shared key.
+
+The event loop is single-threaded and cache operations never span an await,
+so no locking is needed.
+"""
+from cachetools import TTLCache
+
+# Per-user financial summary (/transactions/summary, /analytics/summary).
+# Short TTL like totals_cache: write paths invalidate, but only in the
+# worker that handled the write — the TTL caps how stale the other
+# uvicorn workers' copies can get.
+summary_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def invalidate_summary(user_id: int) -> None:
+    """Drop a user's cached summary after a transaction write."""
+    summary_cache.pop(user_id, None)
+
+
+# Per-user amount totals by type, backing balance and per-type reads.
+# Short TTL: invalidation happens in the repository write paths, the TTL
+# only bounds staleness if a write slips past them (e.g. manual SQL).
+totals_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
+def invalidate_totals(user_id: int) -> None:
+    """Drop a user's cached totals after a transaction write."""
+    totals_cache.pop(user_id, None)
+
+
+# Category ownership metadata keyed by category_id, storing a plain
+# (user_id, type) tuple — detached from any session, which is all the
+# transaction mutation path needs for its ownership check. Categories
+# rarely change, and updates/deletes invalidate explicitly; the TTL covers
+# out-of-band edits.
+category_meta_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+
+
+def invalidate_category(category_id: int) -> None:
+    """Drop a category's cached metadata after an update or delete."""
+    category_meta_cache.pop(category_id, None)
+
+
+# Historical monthly summaries keyed by (user_id, year, month). Closed
+# months rarely change, but a back-dated write only invalidates the worker
+# that handled it — uvicorn runs several processes — so the TTL is the
+# backstop that bounds how long the other workers can serve the old value.
+# The current month is never stored here.
+monthly_cache: TTLCache = TTLCache(maxsize=50_000, ttl=300)
+
+
+def invalidate_monthly(user_id: int) -> None:
+    """Drop all cached monthly summaries for a user.
+
+    User-wide rather than per-month because an update can move a
+    transaction between months and the old month isn't always at hand.
+    """
+    for key in [k for k in monthly_cache if k[0] == user_id]:
+        monthly_cache.pop(key, None)
@@ -1,7 +1,8 @@
 from functools import lru_cache
 from typing import Optional
+from urllib.parse import quote
 
-from pydantic import Field, PostgresDsn, ValidationInfo, field_validator
+from pydantic import Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -18,7 +19,12 @@ class Settings(BaseSettings):
     POSTGRES_SERVER: str = Field(default="db", description="Database server")
     POSTGRES_PORT: int = Field(default=5432, description="Database port")
     POSTGRES_DB: str = Field(..., description="Database name")
-    DATABASE_URL: Optional[PostgresDsn] = None
+    DATABASE_URL: Optional[str] = None
+
+    # Connection pool sizing; keep pool_size + max_overflow below the
+    # Postgres max_connections budget across all workers
+    DB_POOL_SIZE: int = Field(default=20, description="Persistent connections per worker")
+    DB_MAX_OVERFLOW: int = Field(default=30, description="Extra burst connections per worker")
 
     # JWT Settings (Required - no defaults for security)
     SECRET_KEY: str = Field(..., min_length=32, description="JWT secret key for token signing")
@@ -40,25 +46,22 @@ class Settings(BaseSettings):
         if isinstance(v, str) and v:
             return v
 
+        # Plain string assembly: PostgresDsn.build ran full URL parsing and
+        # idna validation on every Settings() construction for a DSN built
+        # from already-validated parts. Only the credentials can contain
+        # URL-special characters, so quote just those.
         data = info.data
-        user = data.get("POSTGRES_USER")
-        password = data.get("POSTGRES_PASSWORD")
+        user = quote(data.get("POSTGRES_USER") or "", safe="")
+        password = quote(data.get("POSTGRES_PASSWORD") or "", safe="")
         server = data.get("POSTGRES_SERVER")
         port = data.get("POSTGRES_PORT")
         db = data.get("POSTGRES_DB")
 
-        return PostgresDsn.build(
-            scheme="postgresql+asyncpg",
-            username=user,
-            password=password,
-            host=server,
-            port=port,
-            path=f"{db}",
-        )
+        return f"postgresql+asyncpg://{user}:{password}@{server}:{port}/{db}"
 
     @property
     def database_url(self) -> str:
-        return str(self.DATABASE_URL)
+        return self.DATABASE_URL
 
 
 @lru_cache
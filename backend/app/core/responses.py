@@ -0,0 +1,52 @@
+from datetime import datetime
+from decimal import Decimal
+from email.utils import format_datetime
+from typing import Any, Optional
+
+import orjson
+from fastapi import Request, Response, status
+from fastapi.responses import ORJSONResponse
+
+
+class DecimalORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also renders Decimal money values as numbers."""
+
+    @staticmethod
+    def _default(obj: Any) -> Any:
+        if isinstance(obj, Decimal):
+            return float(obj)
+        raise TypeError
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=self._default)
+
+
+def conditional_response(
+    request: Request, response: Response, change_marker: Optional[tuple[datetime, int]]
+) -> Optional[Response]:
+    """
+    Apply ETag/Last-Modified caching keyed on a change marker.
+
+    Args:
+        request: Incoming request (read for If-None-Match)
+        response: Outgoing response to attach cache headers to
+        change_marker: (last updated_at, row count) of the underlying data
+
+    Returns:
+        A 304 response if the client's ETag is still valid, None otherwise
+    """
+    if change_marker is None:
+        return None
+    last_modified, row_count = change_marker
+    # Weak ETag from both components: inserts and edits bump updated_at,
+    # deletions change the count — a timestamp alone would keep serving
+    # 304s after a delete that didn't touch the newest row
+    etag = f'W/"{int(last_modified.timestamp())}-{row_count}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
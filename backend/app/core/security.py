@@ -1,42 +1,78 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Any, Union
 
-from jose import jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
 
 from app.core.config import get_settings
 
-settings = get_settings()
+# Token signing inputs never change at runtime, so resolve them once at
+# import instead of per token
+_settings = get_settings()
+_ENCODE_KEY = _settings.SECRET_KEY
+_ALGORITHM = _settings.ALGORITHM
+_DEFAULT_EXPIRE = timedelta(minutes=_settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
-# Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt work factor; hashes produced by the previous passlib setup used
+# the same cost and verify unchanged
+_BCRYPT_ROUNDS = 12
 
+# Hash checked when a login hits an unknown email, so that path costs the
+# same bcrypt work as a real verify and response timing doesn't reveal
+# whether the account exists
+DUMMY_PASSWORD_HASH = bcrypt.hashpw(
+    b"dummy-password", bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)
+).decode("utf-8")
 
-def get_password_hash(password: str) -> str:
+
+def _hash_password(password: str) -> str:
+    return bcrypt.hashpw(
+        password.encode("utf-8"), bcrypt.gensalt(rounds=_BCRYPT_ROUNDS)
+    ).decode("utf-8")
+
+
+def _check_password(plain_password: str, hashed_password: str) -> bool:
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+        )
+    except ValueError:
+        # Malformed/legacy hash value; treat as non-matching
+        return False
+
+
+async def get_password_hash(password: str) -> str:
     """
     Hash a plain password using bcrypt.
-    
+
+    Runs in a worker thread: a bcrypt hash costs hundreds of milliseconds
+    of CPU and would otherwise stall the event loop.
+
     Args:
         password: Plain text password
-        
+
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    return await asyncio.to_thread(_hash_password, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain password against a hashed password.
-    
+
+    Runs in a worker thread so concurrent requests keep progressing while
+    bcrypt burns CPU.
+
     Args:
         plain_password: Plain text password to verify
         hashed_password: Hashed password from database
-        
+
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await asyncio.to_thread(_check_password, plain_password, hashed_password)
 
 
 def create_access_token(subject: Union[str, int], expires_delta: timedelta | None = None) -> str:
@@ -50,12 +86,7 @@ def create_access_token(subject: Union[str, int], expires_delta: timedelta | Non
     Returns:
         Encoded JWT token string
     """
-    if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
-    else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    
+    expire = datetime.now(timezone.utc) + (expires_delta or _DEFAULT_EXPIRE)
     to_encode: dict[str, Any] = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
-    return encoded_jwt
+    return jwt.encode(to_encode, _ENCODE_KEY, algorithm=_ALGORITHM)
 
@@ -1,4 +1,5 @@
 import asyncio
+import random
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
@@ -11,6 +12,7 @@ from slowapi.errors import RateLimitExceeded
 from app.api.v1 import api_router
 from app.core.database import engine
 from app.core.config import get_settings
+from app.core.responses import DecimalORJSONResponse
 
 
 @asynccontextmanager
@@ -22,9 +24,12 @@ async def lifespan(app: FastAPI):
     db_url = settings.database_url.replace(settings.POSTGRES_PASSWORD, "****")
     print(f"🔌 Attempting to connect to: {db_url}")
     
-    max_retries = 5
-    retry_delay = 2
-    
+    # Exponential backoff with jitter: a short first sleep keeps the common
+    # "database is up a moment later" cold start fast, while the capped
+    # doubling still tolerates slow container orchestration
+    max_retries = 8
+    retry_delay = 0.25
+
     for attempt in range(max_retries):
         try:
             async with engine.begin() as conn:
@@ -34,12 +39,24 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             if attempt < max_retries - 1:
                 print(f"⚠️  Database connection attempt {attempt + 1} failed: {e}")
-                print(f"   Retrying in {retry_delay} seconds...")
-                await asyncio.sleep(retry_delay)
+                print(f"   Retrying in {retry_delay:.2f} seconds...")
+                await asyncio.sleep(retry_delay + random.random() * 0.1)
+                retry_delay = min(retry_delay * 2, 4.0)
             else:
                 print(f"❌ Failed to connect to database after {max_retries} attempts")
                 raise
-    
+
+    # Pre-warm the pool: open the persistent connections now so the first
+    # burst of requests doesn't pay TCP + auth + asyncpg type introspection
+    # on the hot path. Checked out concurrently so each lands on a distinct
+    # pooled connection, then released back.
+    conns = await asyncio.gather(
+        *(engine.connect() for _ in range(settings.DB_POOL_SIZE))
+    )
+    for conn in conns:
+        await conn.close()
+    print(f"🔥 Pre-warmed {settings.DB_POOL_SIZE} pooled connections")
+
     yield
 
 
@@ -48,6 +65,9 @@ app = FastAPI(
     description="Driver Finance App backend services",
     version="0.1.0",
     lifespan=lifespan,
+    # orjson serializes datetimes, Decimals and nested dicts in C; every
+    # endpoint inherits this unless it returns an explicit Response
+    default_response_class=DecimalORJSONResponse,
 )
 
 # Configure rate limiting
@@ -26,7 +26,13 @@ class Category(Base):
     )
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     type: Mapped[CategoryType] = mapped_column(
-        Enum(CategoryType, values_callable=lambda obj: [e.value for e in obj]), 
+        Enum(
+            CategoryType,
+            values_callable=lambda obj: [e.value for e in obj],
+            native_enum=False,
+            create_constraint=True,
+            length=7,
+        ),
         nullable=False
     )
     color: Mapped[str] = mapped_column(String(7), default="#6B7280", nullable=False)
@@ -3,7 +3,17 @@ from typing import Optional
 from decimal import Decimal
 import enum
 
-from sqlalchemy import String, DateTime, Integer, ForeignKey, Enum, Numeric, CheckConstraint
+from sqlalchemy import (
+    String,
+    DateTime,
+    Integer,
+    ForeignKey,
+    Enum,
+    Numeric,
+    CheckConstraint,
+    Index,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
@@ -29,7 +39,13 @@ class Transaction(Base):
         Integer, ForeignKey("categories.id", ondelete="SET NULL"), nullable=True, index=True
     )
     type: Mapped[TransactionType] = mapped_column(
-        Enum(TransactionType, values_callable=lambda obj: [e.value for e in obj]),
+        Enum(
+            TransactionType,
+            values_callable=lambda obj: [e.value for e in obj],
+            native_enum=False,
+            create_constraint=True,
+            length=7,
+        ),
         nullable=False
     )
     amount: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
@@ -42,13 +58,30 @@ class Transaction(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
     )
 
-    # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="transactions")
+    # Relationships. user is never serialized, so lazy="raise" turns any
+    # accidental per-row load into an immediate error instead of a hidden
+    # SELECT; category is loaded eagerly at the query sites that need it.
+    user: Mapped["User"] = relationship("User", back_populates="transactions", lazy="raise")
     category: Mapped[Optional["Category"]] = relationship("Category", back_populates="transactions")
 
-    # Table constraints
+    # Table constraints. The composite index matches the list endpoint's
+    # access pattern (filter by user, newest first, optional type filter)
+    # so pagination streams from the index without a sort.
     __table_args__ = (
         CheckConstraint("amount > 0", name="check_amount_positive"),
+        Index(
+            "ix_transactions_user_date",
+            "user_id",
+            text("transaction_date DESC"),
+            text("id DESC"),
+            "type",
+        ),
+        Index(
+            "ix_transactions_user_category",
+            "user_id",
+            "category_id",
+            "transaction_date",
+        ),
     )
 
     def __repr__(self) -> str:
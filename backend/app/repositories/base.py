@@ -1,6 +1,6 @@
 from typing import Generic, TypeVar, Type, Optional, Any
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import Base
@@ -40,8 +40,9 @@ class BaseRepository(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
         Returns:
             Model instance if found, None otherwise
         """
-        result = await db.execute(select(self.model).where(self.model.id == id))
-        return result.scalar_one_or_none()
+        # Primary-key fast path: checks the session identity map first and
+        # answers without SQL when the row was already loaded this request
+        return await db.get(self.model, id)
 
     async def get_multi(
         self, db: AsyncSession, skip: int = 0, limit: int = 100
@@ -62,67 +63,88 @@ class BaseRepository(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
         )
         return list(result.scalars().all())
 
-    async def create(self, db: AsyncSession, obj_in: CreateSchemaT) -> ModelT:
+    async def create(
+        self, db: AsyncSession, obj_in: CreateSchemaT, commit: bool = True
+    ) -> ModelT:
         """
         Create a new record.
-        
+
         Args:
             db: Database session
             obj_in: Creation schema with data
-            
+            commit: Commit immediately; pass False when the caller batches
+                several mutations into one unit of work and commits once
+
         Returns:
             Created model instance
         """
-        obj_data = obj_in.model_dump()
-        db_obj = self.model(**obj_data)
-        db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        # exclude_unset: fields the caller never sent stay out of the dict,
+        # so column defaults apply server-side instead of explicit Nones
+        obj_data = obj_in.model_dump(exclude_unset=True)
+        # INSERT ... RETURNING brings back id and the server defaults with
+        # the insert itself; no refresh SELECT afterwards
+        result = await db.execute(
+            insert(self.model).values(**obj_data).returning(self.model)
+        )
+        db_obj = result.scalar_one()
+        if commit:
+            await db.commit()
         return db_obj
 
     async def update(
-        self, db: AsyncSession, id: int, obj_in: UpdateSchemaT
+        self, db: AsyncSession, id: int, obj_in: UpdateSchemaT, commit: bool = True
     ) -> Optional[ModelT]:
         """
         Update an existing record.
-        
+
         Args:
             db: Database session
             id: Record ID to update
             obj_in: Update schema with data
-            
+            commit: Commit immediately; pass False when the caller batches
+                several mutations into one unit of work and commits once
+
         Returns:
             Updated model instance if found, None otherwise
         """
-        db_obj = await self.get_by_id(db, id)
-        if not db_obj:
-            return None
-
         update_data = obj_in.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_obj, field, value)
+        if not update_data:
+            return await self.get_by_id(db, id)
 
-        await db.commit()
-        await db.refresh(db_obj)
+        # Single UPDATE ... RETURNING instead of SELECT + flush + refresh
+        result = await db.execute(
+            update(self.model)
+            .where(self.model.id == id)
+            .values(**update_data)
+            .returning(self.model)
+        )
+        db_obj = result.scalar_one_or_none()
+        if commit:
+            await db.commit()
         return db_obj
 
-    async def delete(self, db: AsyncSession, id: int) -> Optional[ModelT]:
+    async def delete(
+        self, db: AsyncSession, id: int, commit: bool = True
+    ) -> Optional[ModelT]:
         """
         Delete a record by ID.
-        
+
         Args:
             db: Database session
             id: Record ID to delete
-            
+            commit: Commit immediately; pass False when the caller batches
+                several mutations into one unit of work and commits once
+
         Returns:
             Deleted model instance if found, None otherwise
         """
-        db_obj = await self.get_by_id(db, id)
-        if not db_obj:
-            return None
-
-        await db.delete(db_obj)
-        await db.commit()
+        # Single DELETE ... RETURNING; no fetch-then-delete round trip
+        result = await db.execute(
+            delete(self.model).where(self.model.id == id).returning(self.model)
+        )
+        db_obj = result.scalar_one_or_none()
+        if commit:
+            await db.commit()
         return db_obj
 
     async def exists(self, db: AsyncSession, id: int) -> bool:
@@ -136,6 +158,10 @@ class BaseRepository(Generic[ModelT, CreateSchemaT, UpdateSchemaT]):
         Returns:
             True if record exists, False otherwise
         """
-        result = await self.get_by_id(db, id)
-        return result is not None
+        # SELECT EXISTS(... WHERE id = ?): index-only probe returning a
+        # boolean, no row transfer or ORM hydration
+        result = await db.execute(
+            select(select(self.model.id).where(self.model.id == id).exists())
+        )
+        return bool(result.scalar())
 
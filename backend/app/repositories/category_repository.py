@@ -1,12 +1,25 @@
 from typing import Optional
 
-from sqlalchemy import select, or_
+from sqlalchemy import insert, select, tuple_, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.category import Category, CategoryType
 from app.repositories.base import BaseRepository
 from app.schemas.category import CategoryCreate, CategoryUpdate
 
+# Columns serialized by CategoryResponse; list reads select exactly these so
+# rows skip ORM hydration (no identity map, no relationship instrumentation)
+_CATEGORY_COLS = (
+    Category.id,
+    Category.user_id,
+    Category.name,
+    Category.type,
+    Category.color,
+    Category.icon,
+    Category.is_system,
+    Category.created_at,
+)
+
 
 class CategoryRepository(BaseRepository[Category, CategoryCreate, CategoryUpdate]):
     """Repository for Category model with domain-specific methods."""
@@ -38,98 +51,170 @@ class CategoryRepository(BaseRepository[Category, CategoryCreate, CategoryUpdate
         )
         return result.scalar_one_or_none()
 
+    async def get_by_ids(
+        self, db: AsyncSession, ids: list[int]
+    ) -> dict[int, Category]:
+        """
+        Get several categories by ID in one query.
+
+        Batch counterpart to get_by_id for callers validating many
+        category references at once (e.g. bulk imports): one
+        WHERE id IN (...) round trip instead of one per id.
+
+        Args:
+            db: Database session
+            ids: Category IDs to look up
+
+        Returns:
+            Mapping of id to Category for the ids that exist
+        """
+        if not ids:
+            return {}
+
+        result = await db.execute(select(Category).where(Category.id.in_(ids)))
+        return {category.id: category for category in result.scalars()}
+
+    async def get_by_user_and_names(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        names: list[tuple[str, CategoryType]],
+    ) -> dict[tuple[str, CategoryType], Category]:
+        """
+        Get several categories by (name, type) in one query.
+
+        Import-style callers that resolve N categories through
+        get_by_user_and_name pay N SELECTs; this resolves them all with a
+        single row-value IN list.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            names: (name, type) pairs to look up
+
+        Returns:
+            Mapping of (name, type) to Category for the pairs that exist
+        """
+        if not names:
+            return {}
+
+        result = await db.execute(
+            select(Category).where(
+                Category.user_id == user_id,
+                tuple_(Category.name, Category.type).in_(names),
+            )
+        )
+        return {
+            (category.name, category.type): category
+            for category in result.scalars()
+        }
+
     async def get_user_categories(
         self, db: AsyncSession, user_id: int, skip: int = 0, limit: int = 100
-    ) -> list[Category]:
+    ) -> list[dict]:
         """
         Get all categories for a user (including system categories).
-        
+
+        Returns plain row mappings rather than ORM objects: these rows go
+        straight into CategoryResponse, so hydration would be pure
+        overhead. Write paths keep returning Category instances.
+
         Args:
             db: Database session
             user_id: User ID
             skip: Number of records to skip
             limit: Maximum number of records to return
-            
+
         Returns:
-            List of Category objects
+            List of category row dicts
         """
-        result = await db.execute(
-            select(Category)
-            .where(
-                or_(
-                    Category.user_id == user_id,
-                    Category.is_system == True
-                )
-            )
-            .offset(skip)
-            .limit(limit)
-        )
-        return list(result.scalars().all())
+        # UNION ALL instead of an OR across different columns: each arm is
+        # its own partial-index scan (user rows / system rows) rather than
+        # a bitmap-merge, and system rows have user_id NULL so the arms
+        # can't overlap
+        stmt = union_all(
+            select(*_CATEGORY_COLS).where(Category.user_id == user_id),
+            select(*_CATEGORY_COLS).where(Category.is_system.is_(True)),
+        ).offset(skip).limit(limit)
+        result = await db.execute(stmt)
+        return [dict(row) for row in result.mappings()]
 
     async def get_system_categories(
         self, db: AsyncSession, skip: int = 0, limit: int = 100
-    ) -> list[Category]:
+    ) -> list[dict]:
         """
         Get all system categories.
-        
+
         Args:
             db: Database session
             skip: Number of records to skip
             limit: Maximum number of records to return
-            
+
         Returns:
-            List of system Category objects
+            List of system category row dicts
         """
         result = await db.execute(
-            select(Category)
+            select(*_CATEGORY_COLS)
             .where(Category.is_system == True)
             .offset(skip)
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return [dict(row) for row in result.mappings()]
 
     async def get_by_type(
         self, db: AsyncSession, user_id: int, category_type: CategoryType
-    ) -> list[Category]:
+    ) -> list[dict]:
         """
         Get categories by type for a user (including system categories).
-        
+
         Args:
             db: Database session
             user_id: User ID
             category_type: Category type (income or expense)
-            
+
         Returns:
-            List of Category objects
+            List of category row dicts
         """
-        result = await db.execute(
-            select(Category).where(
-                or_(
-                    Category.user_id == user_id,
-                    Category.is_system == True
-                ),
-                Category.type == category_type
-            )
+        stmt = union_all(
+            select(*_CATEGORY_COLS).where(
+                Category.user_id == user_id,
+                Category.type == category_type,
+            ),
+            select(*_CATEGORY_COLS).where(
+                Category.is_system.is_(True),
+                Category.type == category_type,
+            ),
         )
-        return list(result.scalars().all())
+        result = await db.execute(stmt)
+        return [dict(row) for row in result.mappings()]
 
-    async def create(self, db: AsyncSession, obj_in: CategoryCreate, user_id: int) -> Category:
+    async def create(
+        self, db: AsyncSession, obj_in: CategoryCreate, user_id: int,
+        commit: bool = True,
+    ) -> Category:
         """
         Create a new category for a user.
-        
+
         Args:
             db: Database session
             obj_in: Category creation schema
             user_id: User ID
-            
+            commit: Commit immediately; pass False when the caller batches
+                several mutations into one unit of work and commits once
+
         Returns:
             Created Category object
         """
-        obj_data = obj_in.model_dump()
-        db_category = Category(**obj_data, user_id=user_id, is_system=False)
-        db.add(db_category)
-        await db.commit()
-        await db.refresh(db_category)
+        obj_data = obj_in.model_dump(exclude_unset=True)
+        # INSERT ... RETURNING populates server defaults without a refresh
+        result = await db.execute(
+            insert(Category)
+            .values(**obj_data, user_id=user_id, is_system=False)
+            .returning(Category)
+        )
+        db_category = result.scalar_one()
+        if commit:
+            await db.commit()
         return db_category
 
 
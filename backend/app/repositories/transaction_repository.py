@@ -1,14 +1,28 @@
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 from decimal import Decimal
 
-from sqlalchemy import select, func, and_
+from sqlalchemy import bindparam, delete, insert, select, update, func, and_, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
+from app.core.cache import invalidate_totals, totals_cache
 from app.models.transaction import Transaction, TransactionType
 from app.repositories.base import BaseRepository
 from app.schemas.transaction import TransactionCreate, TransactionUpdate
 
+# Hot aggregate statements built once at import; per-call work is just
+# parameter binding, and the stable structure keeps SQLAlchemy's compiled
+# cache and asyncpg's prepared-statement cache hitting the same entries
+_TOTALS_BY_TYPE = (
+    select(Transaction.type, func.sum(Transaction.amount))
+    .where(Transaction.user_id == bindparam("uid"))
+    .group_by(Transaction.type)
+)
+_CHANGE_MARKER = select(
+    func.max(Transaction.updated_at), func.count(Transaction.id)
+).where(Transaction.user_id == bindparam("uid"))
+
 
 class TransactionRepository(BaseRepository[Transaction, TransactionCreate, TransactionUpdate]):
     """Repository for Transaction model with domain-specific methods."""
@@ -26,25 +40,41 @@ class TransactionRepository(BaseRepository[Transaction, TransactionCreate, Trans
         category_id: Optional[int] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        eager: bool = True,
+        after_date: Optional[datetime] = None,
+        after_id: Optional[int] = None,
     ) -> list[Transaction]:
         """
         Get transactions for a user with optional filters.
-        
+
+        When a keyset cursor (after_date, after_id) is given, the page
+        starts with one index seek past the cursor row — constant cost at
+        any depth — and skip is ignored; OFFSET has to scan and discard
+        skip rows each page.
+
         Args:
             db: Database session
             user_id: User ID
-            skip: Number of records to skip
+            skip: Number of records to skip (OFFSET pagination)
             limit: Maximum number of records to return
             transaction_type: Optional filter by transaction type
             category_id: Optional filter by category
             start_date: Optional filter by start date
             end_date: Optional filter by end date
-            
+            eager: Batch-load categories alongside the rows
+            after_date: Keyset cursor: transaction_date of the last row seen
+            after_id: Keyset cursor: id of the last row seen
+
         Returns:
             List of Transaction objects
         """
         query = select(Transaction).where(Transaction.user_id == user_id)
-        
+
+        # Batch-load categories with one extra SELECT instead of a lazy
+        # load per row when callers touch transaction.category
+        if eager:
+            query = query.options(selectinload(Transaction.category))
+
         if transaction_type:
             query = query.where(Transaction.type == transaction_type)
         
@@ -56,33 +86,221 @@ class TransactionRepository(BaseRepository[Transaction, TransactionCreate, Trans
         
         if end_date:
             query = query.where(Transaction.transaction_date <= end_date)
-        
-        query = query.order_by(Transaction.transaction_date.desc()).offset(skip).limit(limit)
-        
+
+        # Keyset (seek) pagination: resume strictly after the cursor row in
+        # (transaction_date DESC, id DESC) order. The row-value comparison
+        # is matched as one seek on ix_transactions_user_date; OFFSET would
+        # read and throw away every earlier page
+        if after_date is not None and after_id is not None:
+            query = query.where(
+                tuple_(Transaction.transaction_date, Transaction.id)
+                < (after_date, after_id)
+            )
+        elif skip:
+            query = query.offset(skip)
+
+        query = query.order_by(
+            Transaction.transaction_date.desc(), Transaction.id.desc()
+        ).limit(limit)
+
         result = await db.execute(query)
         return list(result.scalars().all())
 
     async def create(
-        self, db: AsyncSession, obj_in: TransactionCreate, user_id: int
+        self, db: AsyncSession, obj_in: TransactionCreate, user_id: int,
+        commit: bool = True,
     ) -> Transaction:
         """
         Create a new transaction for a user.
-        
+
         Args:
             db: Database session
             obj_in: Transaction creation schema
             user_id: User ID
-            
+            commit: Commit immediately. Callers passing False own the
+                commit and must call invalidate_totals afterwards
+
         Returns:
             Created Transaction object
         """
-        obj_data = obj_in.model_dump()
-        db_transaction = Transaction(**obj_data, user_id=user_id)
-        db.add(db_transaction)
-        await db.commit()
-        await db.refresh(db_transaction)
+        obj_data = obj_in.model_dump(exclude_unset=True)
+        # INSERT ... RETURNING populates server defaults without a refresh
+        result = await db.execute(
+            insert(Transaction)
+            .values(**obj_data, user_id=user_id)
+            .returning(Transaction)
+        )
+        db_transaction = result.scalar_one()
+        if commit:
+            await db.commit()
+            invalidate_totals(user_id)
         return db_transaction
 
+    async def bulk_create(
+        self, db: AsyncSession, items: list[TransactionCreate], user_id: int
+    ) -> list[int]:
+        """
+        Insert a batch of transactions for a user in one statement.
+
+        One multi-row INSERT and one commit replace a round trip and an
+        fsync per row, which is what importer-style callers would pay
+        looping over create().
+
+        Args:
+            db: Database session
+            items: Transaction creation schemas
+            user_id: User ID
+
+        Returns:
+            IDs of the created transactions, in input order
+        """
+        if not items:
+            return []
+
+        rows = [item.model_dump() | {"user_id": user_id} for item in items]
+        stmt = insert(Transaction).values(rows).returning(Transaction.id)
+        result = await db.execute(stmt)
+        ids = list(result.scalars().all())
+        await db.commit()
+        invalidate_totals(user_id)
+        return ids
+
+    async def update(
+        self, db: AsyncSession, id: int, obj_in: TransactionUpdate,
+        commit: bool = True, user_id: Optional[int] = None,
+    ) -> Optional[Transaction]:
+        """
+        Update a transaction, dropping the owner's cached totals.
+
+        When user_id is given the ownership predicate rides in the UPDATE
+        itself, so authorization costs no extra SELECT and there is no
+        check-then-mutate race window.
+
+        Args:
+            db: Database session
+            id: Transaction ID
+            obj_in: Schema with fields to update
+            commit: Commit immediately. Callers passing False own the
+                commit and must call invalidate_totals afterwards
+            user_id: Restrict the update to this owner's rows
+
+        Returns:
+            Updated Transaction object if found (and owned), None otherwise
+        """
+        update_data = obj_in.model_dump(exclude_unset=True)
+        conditions = [Transaction.id == id]
+        if user_id is not None:
+            conditions.append(Transaction.user_id == user_id)
+
+        if not update_data:
+            transaction = await self.get_by_id(db, id)
+            if (
+                transaction is not None
+                and user_id is not None
+                and transaction.user_id != user_id
+            ):
+                return None
+            return transaction
+
+        result = await db.execute(
+            update(Transaction)
+            .where(*conditions)
+            .values(**update_data)
+            .returning(Transaction)
+        )
+        transaction = result.scalar_one_or_none()
+        if commit:
+            await db.commit()
+            if transaction is not None:
+                invalidate_totals(transaction.user_id)
+        return transaction
+
+    async def delete(
+        self, db: AsyncSession, id: int, commit: bool = True,
+        user_id: Optional[int] = None,
+    ) -> Optional[Transaction]:
+        """
+        Delete a transaction, dropping the owner's cached totals.
+
+        As with update, a user_id folds the ownership predicate into the
+        DELETE's WHERE clause.
+
+        Args:
+            db: Database session
+            id: Transaction ID
+            commit: Commit immediately. Callers passing False own the
+                commit and must call invalidate_totals afterwards
+            user_id: Restrict the delete to this owner's rows
+
+        Returns:
+            Deleted Transaction object if found (and owned), None otherwise
+        """
+        conditions = [Transaction.id == id]
+        if user_id is not None:
+            conditions.append(Transaction.user_id == user_id)
+
+        result = await db.execute(
+            delete(Transaction).where(*conditions).returning(Transaction)
+        )
+        transaction = result.scalar_one_or_none()
+        if commit:
+            await db.commit()
+            if transaction is not None:
+                invalidate_totals(transaction.user_id)
+        return transaction
+
+    async def get_change_marker(
+        self, db: AsyncSession, user_id: int
+    ) -> Optional[tuple[datetime, int]]:
+        """
+        Get (latest updated_at, row count) for a user's transactions.
+
+        Change marker for HTTP conditional caching. The timestamp alone
+        misses deletions — removing any row that isn't the newest leaves
+        max(updated_at) unchanged — so the row count is folded in from
+        the same aggregate scan to invalidate on deletes as well.
+
+        Args:
+            db: Database session
+            user_id: User ID
+
+        Returns:
+            (max updated_at, count) tuple, or None if the user has no
+            transactions
+        """
+        last_modified, row_count = (
+            await db.execute(_CHANGE_MARKER, {"uid": user_id})
+        ).one()
+        if last_modified is None:
+            return None
+        return last_modified, row_count
+
+    async def get_totals_by_type(
+        self, db: AsyncSession, user_id: int
+    ) -> dict[TransactionType, Decimal]:
+        """
+        Get the summed amount per transaction type in a single query.
+
+        One GROUP BY scan replaces separate per-type aggregates, halving
+        round trips and buffer reads for summary-style callers.
+
+        Args:
+            db: Database session
+            user_id: User ID
+
+        Returns:
+            Mapping of transaction type to total amount; types with no
+            transactions are absent
+        """
+        cached = totals_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        result = await db.execute(_TOTALS_BY_TYPE, {"uid": user_id})
+        totals = {row.type: row[1] for row in result.all()}
+        totals_cache[user_id] = totals
+        return totals
+
     async def get_user_balance(self, db: AsyncSession, user_id: int) -> Decimal:
         """
         Calculate total balance (income - expenses) for a user.
@@ -94,31 +312,11 @@ class TransactionRepository(BaseRepository[Transaction, TransactionCreate, Trans
         Returns:
             Total balance as Decimal
         """
-        # Sum income
-        income_result = await db.execute(
-            select(func.coalesce(func.sum(Transaction.amount), 0))
-            .where(
-                and_(
-                    Transaction.user_id == user_id,
-                    Transaction.type == TransactionType.INCOME
-                )
-            )
-        )
-        total_income = income_result.scalar_one()
-        
-        # Sum expenses
-        expense_result = await db.execute(
-            select(func.coalesce(func.sum(Transaction.amount), 0))
-            .where(
-                and_(
-                    Transaction.user_id == user_id,
-                    Transaction.type == TransactionType.EXPENSE
-                )
-            )
+        # One GROUP BY scan covers both sides of the balance
+        totals = await self.get_totals_by_type(db, user_id)
+        return totals.get(TransactionType.INCOME, Decimal("0")) - totals.get(
+            TransactionType.EXPENSE, Decimal("0")
         )
-        total_expense = expense_result.scalar_one()
-        
-        return Decimal(str(total_income)) - Decimal(str(total_expense))
 
     async def get_total_by_type(
         self, db: AsyncSession, user_id: int, transaction_type: TransactionType
@@ -134,32 +332,73 @@ class TransactionRepository(BaseRepository[Transaction, TransactionCreate, Trans
         Returns:
             Total amount as Decimal
         """
-        result = await db.execute(
-            select(func.coalesce(func.sum(Transaction.amount), 0))
+        totals = await self.get_totals_by_type(db, user_id)
+        return totals.get(transaction_type, Decimal("0"))
+
+    async def get_by_category(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        category_id: int,
+        eager: bool = True,
+        limit: int = 500,
+    ) -> list[Transaction]:
+        """
+        Get transactions for a specific category.
+
+        Bounded by limit; use iter_by_category to walk an unbounded
+        history at constant memory.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            category_id: Category ID
+            eager: Batch-load categories alongside the rows
+            limit: Maximum number of records to return
+
+        Returns:
+            List of Transaction objects
+        """
+        query = (
+            select(Transaction)
             .where(
                 and_(
                     Transaction.user_id == user_id,
-                    Transaction.type == transaction_type
+                    Transaction.category_id == category_id
                 )
             )
+            .order_by(Transaction.transaction_date.desc())
+            .limit(limit)
         )
-        return Decimal(str(result.scalar_one()))
+        if eager:
+            query = query.options(selectinload(Transaction.category))
 
-    async def get_by_category(
-        self, db: AsyncSession, user_id: int, category_id: int
-    ) -> list[Transaction]:
+        result = await db.execute(query)
+        return list(result.scalars().all())
+
+    async def iter_by_category(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        category_id: int,
+        batch_size: int = 500,
+    ) -> AsyncIterator[Transaction]:
         """
-        Get all transactions for a specific category.
-        
+        Stream all transactions for a category from a server-side cursor.
+
+        Rows are hydrated in batch_size batches as the caller iterates,
+        so memory stays flat no matter how deep the history is.
+
         Args:
             db: Database session
             user_id: User ID
             category_id: Category ID
-            
-        Returns:
-            List of Transaction objects
+            batch_size: Rows fetched and hydrated per cursor round trip
+
+        Yields:
+            Transaction objects, newest first
         """
-        result = await db.execute(
+        stmt = (
             select(Transaction)
             .where(
                 and_(
@@ -168,8 +407,11 @@ class TransactionRepository(BaseRepository[Transaction, TransactionCreate, Trans
                 )
             )
             .order_by(Transaction.transaction_date.desc())
+            .execution_options(yield_per=batch_size)
         )
-        return list(result.scalars().all())
+        result = await db.stream_scalars(stmt)
+        async for transaction in result:
+            yield transaction
 
 
 # Singleton instance
@@ -1,14 +1,26 @@
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import get_password_hash, verify_password
+from app.core.security import (
+    DUMMY_PASSWORD_HASH,
+    get_password_hash,
+    verify_password,
+)
 from app.models.user import User
 from app.repositories.base import BaseRepository
 from app.schemas.user import UserCreate, UserUpdate
 
 
+# Hot-path statements built once at import; execution only binds parameters,
+# skipping the per-call select() construction and cache-key derivation
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email")).limit(1)
+_ACTIVE_USER_BY_ID = select(User).where(
+    User.id == bindparam("id"), User.is_active.is_(True)
+)
+
+
 class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
     """Repository for User model with domain-specific methods."""
 
@@ -18,15 +30,33 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
     async def get_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
         """
         Get user by email address.
-        
+
         Args:
             db: Database session
             email: Email address to search for
-            
+
         Returns:
             User object if found, None otherwise
         """
-        result = await db.execute(select(User).where(User.email == email))
+        # email is unique; LIMIT 1 tells the planner a single row suffices
+        result = await db.execute(_USER_BY_EMAIL, {"email": email})
+        return result.scalar_one_or_none()
+
+    async def get_active_by_id(self, db: AsyncSession, id: int) -> Optional[User]:
+        """
+        Get an active user by ID.
+
+        The is_active filter runs in SQL so callers that only accept active
+        users don't fetch and discard inactive rows.
+
+        Args:
+            db: Database session
+            id: User ID
+
+        Returns:
+            User object if found and active, None otherwise
+        """
+        result = await db.execute(_ACTIVE_USER_BY_ID, {"id": id})
         return result.scalar_one_or_none()
 
     async def create(self, db: AsyncSession, obj_in: UserCreate) -> User:
@@ -41,53 +71,93 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
             Created User object
         """
         # Hash the password before storing
-        hashed_password = get_password_hash(obj_in.password)
-        
-        db_user = User(
-            email=obj_in.email,
-            hashed_password=hashed_password,
-            full_name=obj_in.full_name,
-            is_active=True,
-            is_superuser=False,
+        hashed_password = await get_password_hash(obj_in.password)
+
+        # INSERT ... RETURNING picks up the server-generated id/timestamps
+        # in the same round trip, replacing the post-commit refresh SELECT
+        result = await db.execute(
+            insert(User)
+            .values(
+                email=obj_in.email,
+                hashed_password=hashed_password,
+                full_name=obj_in.full_name,
+                is_active=True,
+                is_superuser=False,
+            )
+            .returning(User)
         )
-        
-        db.add(db_user)
+        db_user = result.scalar_one()
         await db.commit()
-        await db.refresh(db_user)
         return db_user
 
+    @staticmethod
+    async def _prepare_update_data(obj_in: UserUpdate) -> dict:
+        """Dump the set update fields, replacing password with its hash."""
+        update_data = obj_in.model_dump(exclude_unset=True)
+        if "password" in update_data:
+            hashed_password = await get_password_hash(update_data["password"])
+            del update_data["password"]
+            update_data["hashed_password"] = hashed_password
+        return update_data
+
     async def update(
         self, db: AsyncSession, id: int, obj_in: UserUpdate
     ) -> Optional[User]:
         """
         Update user fields, handling password hashing.
-        
+
         Args:
             db: Database session
             id: ID of user to update
             obj_in: Schema with fields to update
-            
+
         Returns:
             Updated User object if found, None otherwise
         """
-        user = await self.get_by_id(db, id)
-        if not user:
-            return None
-        
-        update_data = obj_in.model_dump(exclude_unset=True)
-        
-        # Hash password if it's being updated
-        if "password" in update_data:
-            hashed_password = get_password_hash(update_data["password"])
-            del update_data["password"]
-            update_data["hashed_password"] = hashed_password
-        
-        for field, value in update_data.items():
-            setattr(user, field, value)
-        
+        update_data = await self._prepare_update_data(obj_in)
+        if not update_data:
+            return await self.get_by_id(db, id)
+
+        # Single UPDATE ... RETURNING: no preliminary SELECT, no refresh
+        result = await db.execute(
+            update(User).where(User.id == id).values(**update_data).returning(User)
+        )
         await db.commit()
-        await db.refresh(user)
-        return user
+        return result.scalar_one_or_none()
+
+    async def update_if_email_free(
+        self, db: AsyncSession, id: int, obj_in: UserUpdate
+    ) -> Optional[User]:
+        """
+        Update a user, atomically guarding the new email's uniqueness.
+
+        The uniqueness check rides inside the UPDATE as a NOT EXISTS
+        predicate, so the check and the write are one statement — no
+        separate SELECT round trip and no window for a concurrent signup
+        to race the check.
+
+        Args:
+            db: Database session
+            id: ID of user to update
+            obj_in: Schema with fields to update; email must be set
+
+        Returns:
+            Updated User object, or None if the email belongs to another user
+        """
+        update_data = await self._prepare_update_data(obj_in)
+        email_taken = (
+            select(User.id)
+            .where(User.email == update_data["email"], User.id != id)
+            .exists()
+        )
+        result = await db.execute(
+            update(User)
+            .where(User.id == id, ~email_taken)
+            .values(**update_data)
+            .returning(User)
+        )
+        await db.commit()
+        return result.scalar_one_or_none()
 
     async def authenticate(
         self, db: AsyncSession, email: str, password: str
@@ -105,8 +175,11 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
         """
         user = await self.get_by_email(db, email)
         if not user:
+            # Burn the same bcrypt work as a real check so unknown emails
+            # aren't distinguishable by response time
+            await verify_password(password, DUMMY_PASSWORD_HASH)
             return None
-        if not verify_password(password, user.hashed_password):
+        if not await verify_password(password, user.hashed_password):
             return None
         return user
 
@@ -41,7 +41,8 @@ class TransactionResponse(TransactionBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    # Read-only snapshot; see UserResponse for the frozen/extra rationale
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
 
 class TransactionFilter(BaseModel):
@@ -53,6 +54,10 @@ class TransactionFilter(BaseModel):
     end_date: Optional[datetime] = None
     skip: int = Field(default=0, ge=0)
     limit: int = Field(default=50, ge=1, le=100)
+    # Keyset cursor: both fields of the last row seen; when set, pagination
+    # seeks past them instead of scanning and discarding skip rows
+    after_date: Optional[datetime] = None
+    after_id: Optional[int] = None
 
 
 class TransactionInDB(TransactionBase):
@@ -49,5 +49,8 @@ class UserResponse(UserBase):
     created_at: datetime
     updated_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    # frozen: responses are read-only snapshots, and freezing lets pydantic
+    # skip assignment plumbing; extra="ignore" drops unknown ORM attributes
+    # without validating them
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra="ignore")
 
@@ -1,15 +1,84 @@
+import time
 from typing import Optional
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from decimal import Decimal
 
-from sqlalchemy import select, func, and_, extract, cast, Date
+from sqlalchemy import bindparam, select, func, and_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import monthly_cache
+from app.core.database import engine
 from app.models.transaction import Transaction, TransactionType
 from app.models.category import Category
 from app.repositories.transaction_repository import transaction_repository
 from app.repositories.category_repository import category_repository
 
+# Debounce window for mv_daily_summary refreshes: writes schedule a refresh
+# as a background task, and at most one full refresh runs per window no
+# matter how many transactions land in it
+_MV_REFRESH_INTERVAL = 60.0
+_last_mv_refresh = 0.0
+
+
+async def refresh_daily_summary_view(force: bool = False) -> bool:
+    """
+    Refresh mv_daily_summary, at most once per debounce window.
+
+    The view backs dashboard/reporting reads; the API endpoints keep
+    querying the live table so their responses stay exactly fresh.
+
+    Args:
+        force: Refresh even if the debounce window has not elapsed
+
+    Returns:
+        True if a refresh ran, False if it was debounced
+    """
+    global _last_mv_refresh
+    now = time.monotonic()
+    if not force and now - _last_mv_refresh < _MV_REFRESH_INTERVAL:
+        return False
+    _last_mv_refresh = now
+
+    # REFRESH ... CONCURRENTLY cannot run inside a transaction block
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(
+            text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_daily_summary")
+        )
+    return True
+
+
+# Fixed-shape summary statements built once at import, following the
+# repository pattern for hot statements: per-call work is parameter
+# binding only, and the stable structure keeps SQLAlchemy's compiled cache
+# and asyncpg's prepared statements hitting the same entries. Breakdown
+# and fuel queries keep per-call construction — their filters are optional,
+# so their shape varies.
+_IS_INCOME = Transaction.type == TransactionType.INCOME
+_IS_EXPENSE = Transaction.type == TransactionType.EXPENSE
+_IS_FUEL = and_(_IS_EXPENSE, Transaction.category_id == 1)
+_PERIOD = and_(
+    Transaction.user_id == bindparam("uid"),
+    Transaction.transaction_date >= bindparam("start"),
+    Transaction.transaction_date < bindparam("end"),
+)
+
+_MONTHLY_SUMMARY = select(
+    func.coalesce(func.sum(Transaction.amount).filter(_IS_INCOME), 0).label("total_income"),
+    func.count(Transaction.id).filter(_IS_INCOME).label("income_count"),
+    func.coalesce(func.sum(Transaction.amount).filter(_IS_EXPENSE), 0).label("total_expenses"),
+    func.count(Transaction.id).filter(_IS_EXPENSE).label("expense_count"),
+).where(_PERIOD)
+
+_DAILY_SUMMARY = select(
+    func.coalesce(func.sum(Transaction.amount).filter(_IS_INCOME), 0).label("total_income"),
+    func.count(Transaction.id).filter(_IS_INCOME).label("income_count"),
+    func.coalesce(func.sum(Transaction.amount).filter(_IS_EXPENSE), 0).label("total_expenses"),
+    func.count(Transaction.id).filter(_IS_EXPENSE).label("expense_count"),
+    func.coalesce(func.sum(Transaction.amount).filter(_IS_FUEL), 0).label("total_fuel"),
+    func.count(Transaction.id).filter(_IS_FUEL).label("fuel_count"),
+).where(_PERIOD)
+
 
 class AnalyticsService:
     """Service for analytics and reporting."""
@@ -33,54 +102,52 @@ class AnalyticsService:
         Returns:
             Dictionary with monthly income, expenses, balance, and transaction count
         """
-        # Get income for the month
-        income_result = await db.execute(
-            select(
-                func.coalesce(func.sum(Transaction.amount), 0).label("total"),
-                func.count(Transaction.id).label("count")
-            )
-            .where(
-                and_(
-                    Transaction.user_id == user_id,
-                    Transaction.type == TransactionType.INCOME,
-                    extract("year", Transaction.transaction_date) == year,
-                    extract("month", Transaction.transaction_date) == month
-                )
-            )
+        # Closed months rarely change, so serve them from the cache; the
+        # current month always recomputes. Back-dated writes drop the
+        # handling worker's entries via invalidate_monthly, and the
+        # cache's TTL bounds staleness on the other workers.
+        today = date.today()
+        is_historical = (year, month) < (today.year, today.month)
+        if is_historical:
+            cached = monthly_cache.get((user_id, year, month))
+            if cached is not None:
+                return cached
+
+        # Half-open [month_start, next_month_start) range instead of
+        # extract(): the bare column comparison is sargable, so the
+        # (user_id, transaction_date) index bounds the scan to the month
+        month_start = datetime(year, month, 1)
+        next_month_start = (
+            datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
         )
-        income_data = income_result.one()
-        
-        # Get expenses for the month
-        expense_result = await db.execute(
-            select(
-                func.coalesce(func.sum(Transaction.amount), 0).label("total"),
-                func.count(Transaction.id).label("count")
-            )
-            .where(
-                and_(
-                    Transaction.user_id == user_id,
-                    Transaction.type == TransactionType.EXPENSE,
-                    extract("year", Transaction.transaction_date) == year,
-                    extract("month", Transaction.transaction_date) == month
-                )
-            )
+
+        # Income and expense aggregates come from a single scan of the
+        # month's rows using FILTER clauses instead of one query per type
+        result = await db.execute(
+            _MONTHLY_SUMMARY,
+            {"uid": user_id, "start": month_start, "end": next_month_start},
         )
-        expense_data = expense_result.one()
+        data = result.one()
         
-        total_income = Decimal(str(income_data.total))
-        total_expenses = Decimal(str(expense_data.total))
+        # asyncpg already returns NUMERIC aggregates as Decimal; no
+        # string round-trip needed
+        total_income = data.total_income
+        total_expenses = data.total_expenses
         balance = total_income - total_expenses
         
-        return {
+        summary = {
             "year": year,
             "month": month,
             "total_income": float(total_income),
-            "income_count": income_data.count,
+            "income_count": data.income_count,
             "total_expenses": float(total_expenses),
-            "expense_count": expense_data.count,
+            "expense_count": data.expense_count,
             "balance": float(balance),
-            "total_transactions": income_data.count + expense_data.count,
+            "total_transactions": data.income_count + data.expense_count,
         }
+        if is_historical:
+            monthly_cache[(user_id, year, month)] = summary
+        return summary
 
     async def get_daily_summary(
         self, db: AsyncSession, user_id: int, target_date: date
@@ -96,77 +163,39 @@ class AnalyticsService:
         Returns:
             Dictionary with daily income, expenses, balance, fuel expenses and transaction count
         """
-        # Get income for the day
-        income_result = await db.execute(
-            select(
-                func.coalesce(func.sum(Transaction.amount), 0).label("total"),
-                func.count(Transaction.id).label("count")
-            )
-            .where(
-                and_(
-                    Transaction.user_id == user_id,
-                    Transaction.type == TransactionType.INCOME,
-                    cast(Transaction.transaction_date, Date) == target_date
-                )
-            )
+        # One scan of the day's rows computes all six aggregates via
+        # FILTER clauses; previously income, expenses and fuel each made
+        # their own round trip over the same slice. Half-open day range
+        # instead of cast(..., Date): casting the column defeats the
+        # index, a bare range comparison does not.
+        day_start = datetime.combine(target_date, datetime.min.time())
+        next_day_start = day_start + timedelta(days=1)
+        result = await db.execute(
+            _DAILY_SUMMARY,
+            {"uid": user_id, "start": day_start, "end": next_day_start},
         )
-        income_data = income_result.one()
-        
-        # Get expenses for the day
-        expense_result = await db.execute(
-            select(
-                func.coalesce(func.sum(Transaction.amount), 0).label("total"),
-                func.count(Transaction.id).label("count")
-            )
-            .where(
-                and_(
-                    Transaction.user_id == user_id,
-                    Transaction.type == TransactionType.EXPENSE,
-                    cast(Transaction.transaction_date, Date) == target_date
-                )
-            )
-        )
-        expense_data = expense_result.one()
-        
-        total_income = Decimal(str(income_data.total))
-        total_expenses = Decimal(str(expense_data.total))
+        data = result.one()
+
+        total_income = data.total_income
+        total_expenses = data.total_expenses
         balance = total_income - total_expenses
 
-        fuel_result = await db.execute(
-            select(
-                func.coalesce(func.sum(Transaction.amount), 0).label("total"),
-                func.count(Transaction.id).label("count")
-            )
-            .where(
-                and_(
-                    Transaction.user_id == user_id,
-                    Transaction.type == TransactionType.EXPENSE,
-                    Transaction.category_id == 1,
-                    cast(Transaction.transaction_date, Date) == target_date
-                )
-            )
-        )
-        fuel_data = fuel_result.one()
-        
-        total_fuel_expenses = Decimal(str(fuel_data.total))
-        fuel_transaction_count = fuel_data.count
-        
         # Avoid division by zero
-        if fuel_transaction_count > 0:
-            average_fuel_expense = total_fuel_expenses / fuel_transaction_count
+        if data.fuel_count > 0:
+            average_fuel_expense = data.total_fuel / data.fuel_count
         else:
             average_fuel_expense = Decimal("0")
-        
+
         return {
             "date": target_date.isoformat(),
             "total_income": float(total_income),
-            "income_count": income_data.count,
+            "income_count": data.income_count,
             "total_expenses": float(total_expenses),
-            "expense_count": expense_data.count,
+            "expense_count": data.expense_count,
             "balance": float(balance),
-            "total_transactions": income_data.count + expense_data.count,
-            "total_fuel_expenses": float(total_fuel_expenses),
-            "fuel_transaction_count": fuel_transaction_count,
+            "total_transactions": data.income_count + data.expense_count,
+            "total_fuel_expenses": float(data.total_fuel),
+            "fuel_transaction_count": data.fuel_count,
             "average_fuel_expense": float(average_fuel_expense),
         }
 
@@ -177,17 +206,19 @@ class AnalyticsService:
         transaction_type: Optional[TransactionType] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        limit: Optional[int] = None,
     ) -> list[dict]:
         """
         Get spending/income breakdown by category.
-        
+
         Args:
             db: Database session
             user_id: User ID
             transaction_type: Optional filter by type
             start_date: Optional start date filter
             end_date: Optional end date filter
-            
+            limit: Optional cap on categories returned (top N by total)
+
         Returns:
             List of dictionaries with category details and totals
         """
@@ -215,21 +246,28 @@ class AnalyticsService:
         if end_date:
             query = query.where(Transaction.transaction_date <= end_date)
         
-        result = await db.execute(query.order_by(func.sum(Transaction.amount).desc()))
-        
-        breakdown = []
-        for row in result:
-            breakdown.append({
+        query = query.order_by(func.sum(Transaction.amount).desc())
+        # LIMIT turns the grouped sort into a Top-N heap instead of
+        # ordering every category
+        if limit is not None:
+            query = query.limit(limit)
+
+        result = await db.execute(query)
+
+        # Totals stay Decimal here; the orjson response class renders them
+        # as floats, so the per-row float() was a redundant conversion
+        return [
+            {
                 "category_id": row.id,
                 "category_name": row.name,
                 "category_type": row.type,
                 "category_color": row.color,
                 "category_icon": row.icon,
-                "total": float(row.total),
+                "total": row.total,
                 "transaction_count": row.count,
-            })
-        
-        return breakdown
+            }
+            for row in result
+        ]
 
     async def get_fuel_analytics(
         self,
@@ -252,35 +290,25 @@ class AnalyticsService:
         Returns:
             Dictionary with fuel spending statistics
         """
-        # Find fuel category
-        fuel_categories = await db.execute(
-            select(Category.id).where(
+        # Join against categories instead of fetching fuel category ids
+        # first: one round trip, and the planner joins the tiny categories
+        # table itself rather than consuming a client-built IN list. An
+        # empty match set falls out as zeros via COALESCE/COUNT.
+        query = (
+            select(
+                func.coalesce(func.sum(Transaction.amount), 0).label("total"),
+                func.count(Transaction.id).label("count"),
+                func.coalesce(func.avg(Transaction.amount), 0).label("average")
+            )
+            .join(Category, Category.id == Transaction.category_id)
+            .where(
                 and_(
+                    Transaction.user_id == user_id,
                     Category.name.ilike("%combustível%"),
                     Category.type == TransactionType.EXPENSE
                 )
             )
         )
-        fuel_category_ids = [row[0] for row in fuel_categories]
-        
-        if not fuel_category_ids:
-            return {
-                "total_fuel_expenses": 0.0,
-                "fuel_transaction_count": 0,
-                "average_fuel_expense": 0.0,
-            }
-        
-        # Build query
-        query = select(
-            func.coalesce(func.sum(Transaction.amount), 0).label("total"),
-            func.count(Transaction.id).label("count"),
-            func.coalesce(func.avg(Transaction.amount), 0).label("average")
-        ).where(
-            and_(
-                Transaction.user_id == user_id,
-                Transaction.category_id.in_(fuel_category_ids)
-            )
-        )
         
         if start_date:
             query = query.where(Transaction.transaction_date >= start_date)
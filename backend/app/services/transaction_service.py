@@ -5,6 +5,12 @@ from decimal import Decimal
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import (
+    category_meta_cache,
+    invalidate_monthly,
+    invalidate_summary,
+    summary_cache,
+)
 from app.models.transaction import TransactionType
 from app.repositories.transaction_repository import transaction_repository
 from app.repositories.category_repository import category_repository
@@ -18,6 +24,70 @@ class TransactionService:
         self.transaction_repo = transaction_repository
         self.category_repo = category_repository
 
+    async def _validate_category(
+        self, db: AsyncSession, category_id: int, user_id: int
+    ) -> None:
+        """
+        Check that a category exists and is usable by the user.
+
+        Reads through the category metadata cache, so repeated mutations
+        against the same (typically system) category skip the lookup
+        round trip entirely.
+
+        Args:
+            db: Database session
+            category_id: Category ID to validate
+            user_id: User ID claiming the category
+
+        Raises:
+            HTTPException: If the category is missing or owned by another user
+        """
+        meta = category_meta_cache.get(category_id)
+        if meta is None:
+            category = await self.category_repo.get_by_id(db, category_id)
+            if not category:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Category not found"
+                )
+            # Cache a detached projection, never the ORM instance
+            meta = (category.user_id, category.type)
+            category_meta_cache[category_id] = meta
+
+        owner_id = meta[0]
+        # Check if category belongs to user or is a system category
+        if owner_id is not None and owner_id != user_id:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Category does not belong to this user"
+            )
+
+    async def _raise_missing_or_forbidden(
+        self, db: AsyncSession, transaction_id: int
+    ) -> None:
+        """
+        Classify a failed owned mutation as 404 or 403.
+
+        Only runs on the error path: one EXISTS probe tells whether the
+        row is missing entirely or belongs to someone else.
+
+        Args:
+            db: Database session
+            transaction_id: Transaction ID the mutation targeted
+
+        Raises:
+            HTTPException: 403 if the row exists under another user, 404 otherwise
+        """
+        if await self.transaction_repo.exists(db, transaction_id):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Transaction does not belong to this user"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transaction not found"
+        )
+
     async def create_transaction(
         self, db: AsyncSession, transaction_data: TransactionCreate, user_id: int
     ):
@@ -40,20 +110,12 @@ class TransactionService:
         """
         # Validate category if provided
         if transaction_data.category_id:
-            category = await self.category_repo.get_by_id(db, transaction_data.category_id)
-            if not category:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Category not found"
-                )
-            # Check if category belongs to user or is a system category
-            if category.user_id is not None and category.user_id != user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Category does not belong to this user"
-                )
-        
-        return await self.transaction_repo.create(db, transaction_data, user_id)
+            await self._validate_category(db, transaction_data.category_id, user_id)
+
+        transaction = await self.transaction_repo.create(db, transaction_data, user_id)
+        invalidate_summary(user_id)
+        invalidate_monthly(user_id)
+        return transaction
 
     async def get_user_transactions(
         self, db: AsyncSession, user_id: int, filters: TransactionFilter
@@ -78,6 +140,8 @@ class TransactionService:
             category_id=filters.category_id,
             start_date=filters.start_date,
             end_date=filters.end_date,
+            after_date=filters.after_date,
+            after_id=filters.after_id,
         )
 
     async def get_transaction(self, db: AsyncSession, transaction_id: int, user_id: int):
@@ -130,24 +194,20 @@ class TransactionService:
         Raises:
             HTTPException: If validation fails
         """
-        # Verify transaction belongs to user
-        transaction = await self.get_transaction(db, transaction_id, user_id)
-        
         # Validate category if being updated
         if transaction_data.category_id is not None:
-            category = await self.category_repo.get_by_id(db, transaction_data.category_id)
-            if not category:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Category not found"
-                )
-            if category.user_id is not None and category.user_id != user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail="Category does not belong to this user"
-                )
-        
-        return await self.transaction_repo.update(db, transaction_id, transaction_data)
+            await self._validate_category(db, transaction_data.category_id, user_id)
+
+        # Ownership is enforced inside the UPDATE's WHERE clause — no
+        # pre-flight SELECT on the happy path
+        updated = await self.transaction_repo.update(
+            db, transaction_id, transaction_data, user_id=user_id
+        )
+        if updated is None:
+            await self._raise_missing_or_forbidden(db, transaction_id)
+        invalidate_summary(user_id)
+        invalidate_monthly(user_id)
+        return updated
 
     async def delete_transaction(self, db: AsyncSession, transaction_id: int, user_id: int):
         """
@@ -164,10 +224,16 @@ class TransactionService:
         Raises:
             HTTPException: If transaction not found or doesn't belong to user
         """
-        # Verify transaction belongs to user
-        await self.get_transaction(db, transaction_id, user_id)
-        
-        return await self.transaction_repo.delete(db, transaction_id)
+        # Ownership is enforced inside the DELETE's WHERE clause — no
+        # pre-flight SELECT on the happy path
+        deleted = await self.transaction_repo.delete(
+            db, transaction_id, user_id=user_id
+        )
+        if deleted is None:
+            await self._raise_missing_or_forbidden(db, transaction_id)
+        invalidate_summary(user_id)
+        invalidate_monthly(user_id)
+        return deleted
 
     async def get_summary(self, db: AsyncSession, user_id: int) -> dict:
         """
@@ -180,19 +246,24 @@ class TransactionService:
         Returns:
             Dictionary with income, expenses, and balance totals
         """
-        total_income = await self.transaction_repo.get_total_by_type(
-            db, user_id, TransactionType.INCOME
-        )
-        total_expenses = await self.transaction_repo.get_total_by_type(
-            db, user_id, TransactionType.EXPENSE
-        )
-        balance = await self.transaction_repo.get_user_balance(db, user_id)
-        
-        return {
+        # Cached per user; any transaction write for the user invalidates
+        cached = summary_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        # Single GROUP BY scan; income, expenses and balance derive from it
+        totals = await self.transaction_repo.get_totals_by_type(db, user_id)
+        total_income = totals.get(TransactionType.INCOME, Decimal("0"))
+        total_expenses = totals.get(TransactionType.EXPENSE, Decimal("0"))
+        balance = total_income - total_expenses
+
+        summary = {
             "total_income": float(total_income),
             "total_expenses": float(total_expenses),
             "balance": float(balance),
         }
+        summary_cache[user_id] = summary
+        return summary
 
 
 # Singleton instance
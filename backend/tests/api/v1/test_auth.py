@@ -0,0 +1,265 @@
+"""
+Authentication API Tests
+
+Integration tests for the auth endpoints:
+- POST /api/v1/auth/signup
+- POST /api/v1/auth/login
+- GET /api/v1/users/me (as the canonical protected endpoint)
+
+Tests are independent of each other and safe to shard across pytest-xdist
+workers: each test's writes roll back with its savepointed session, and
+user_factory emails are worker-suffixed (see conftest).
+"""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import jwt
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import get_settings
+
+SIGNUP_URL = "/api/v1/auth/signup"
+LOGIN_URL = "/api/v1/auth/login"
+ME_URL = "/api/v1/users/me"
+
+# Bound once: token verification inputs never change during a test run,
+# and plain module constants skip pydantic attribute resolution per test
+_settings = get_settings()
+SECRET_KEY = _settings.SECRET_KEY
+ALGORITHM = _settings.ALGORITHM
+
+
+def _login_form(user_data: dict[str, Any]) -> dict[str, str]:
+    """Build the OAuth2 form payload for the login endpoint."""
+    return {"username": user_data["email"], "password": user_data["password"]}
+
+
+class TestSignup:
+    """Tests for POST /api/v1/auth/signup."""
+
+    async def test_signup_success_with_valid_data(
+        self, client: AsyncClient, user_factory: Callable[..., dict[str, Any]]
+    ) -> None:
+        """Signing up with valid data returns 201 and no password material."""
+        user_data = user_factory(1)
+
+        response = await client.post(SIGNUP_URL, json=user_data)
+
+        assert response.status_code == 201
+        body = response.json()
+        assert body["email"] == user_data["email"]
+        assert body["full_name"] == user_data["full_name"]
+        assert "id" in body
+        assert "password" not in body
+        assert "hashed_password" not in body
+
+    async def test_signup_failure_with_duplicate_email(
+        self, client: AsyncClient, user_factory: Callable[..., dict[str, Any]]
+    ) -> None:
+        """Re-registering an email returns 400 even with different details."""
+        user_data = user_factory(1)
+        first = await client.post(SIGNUP_URL, json=user_data)
+        assert first.status_code == 201
+
+        duplicate_data = user_data.copy()
+        duplicate_data["password"] = "DifferentPassword123!"
+        duplicate_data["full_name"] = "Different Name"
+
+        response = await client.post(SIGNUP_URL, json=duplicate_data)
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Email already registered"
+
+
+class TestLogin:
+    """Tests for POST /api/v1/auth/login."""
+
+    async def test_login_success_with_valid_credentials(
+        self, client: AsyncClient, test_user: dict[str, Any]
+    ) -> None:
+        """Logging in returns a bearer token whose subject is the user id."""
+        user_id = test_user["id"]
+
+        response = await client.post(LOGIN_URL, data=_login_form(test_user))
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["token_type"] == "bearer"
+        claims = jwt.decode(
+            body["access_token"], SECRET_KEY, algorithms=[ALGORITHM]
+        )
+        assert claims["sub"] == str(user_id)
+
+    async def test_login_failure_with_wrong_password(
+        self,
+        client: AsyncClient,
+        test_user: dict[str, Any],
+        fake_bcrypt: None,
+    ) -> None:
+        """A wrong password returns 401 with a WWW-Authenticate challenge."""
+        form = _login_form(test_user) | {"password": "WrongPassword999!"}
+        response = await client.post(LOGIN_URL, data=form)
+
+        assert response.status_code == 401
+        assert response.headers["WWW-Authenticate"] == "Bearer"
+
+    async def test_login_failure_with_nonexistent_email(
+        self,
+        client: AsyncClient,
+        user_factory: Callable[..., dict[str, Any]],
+        fake_bcrypt: None,
+    ) -> None:
+        """An unknown email returns 401, indistinguishable from a bad password."""
+        # Nothing registers this account, so the email does not exist
+        response = await client.post(LOGIN_URL, data=_login_form(user_factory(1)))
+
+        assert response.status_code == 401
+        assert response.json()["detail"] == "Incorrect email or password"
+
+
+class TestRequestValidation:
+    """422 responses from request validation, across auth endpoints.
+
+    All 422 cases share one parametrized body: they exercise the same
+    pydantic/form validation layer and reject before any handler or
+    database work, so there is nothing endpoint-specific to assert.
+    """
+
+    @pytest.mark.parametrize(
+        ("url", "kind", "payload"),
+        [
+            pytest.param(
+                SIGNUP_URL,
+                "json",
+                {
+                    "email": "not-an-email",
+                    "password": "ValidPassword123!",
+                    "full_name": "Test User",
+                },
+                id="signup-invalid-email",
+            ),
+            pytest.param(
+                SIGNUP_URL,
+                "json",
+                {
+                    "email": "shortpass@example.com",
+                    "password": "short1!",
+                    "full_name": "Test User",
+                },
+                id="signup-short-password",
+            ),
+            pytest.param(
+                LOGIN_URL,
+                "data",
+                {"username": "x@example.com"},
+                id="login-missing-password",
+            ),
+        ],
+    )
+    async def test_validation_failure_returns_422(
+        self,
+        client: AsyncClient,
+        url: str,
+        kind: str,
+        payload: dict[str, str],
+    ) -> None:
+        """Bodies that fail request validation are rejected with 422."""
+        response = await client.post(url, **{kind: payload})
+
+        assert response.status_code == 422
+
+
+class TestProtectedEndpoints:
+    """Tests for bearer-token enforcement on protected routes."""
+
+    async def test_protected_endpoint_success_with_valid_token(
+        self,
+        client: AsyncClient,
+        test_user: dict[str, Any],
+        auth_headers: dict[str, str],
+    ) -> None:
+        """A valid bearer token resolves /users/me to the account's profile."""
+        response = await client.get(ME_URL, headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json()["email"] == test_user["email"]
+
+    async def test_protected_endpoint_failure_matrix(
+        self, client: AsyncClient
+    ) -> None:
+        """Missing header, bad scheme and malformed token all get 401."""
+        # HTTPBearer rejects a missing header or non-Bearer scheme with
+        # 401 ("Not authenticated"); a malformed token fails JWT decoding
+        # with 401 as well. The requests are independent failures, so
+        # fire them concurrently on the shared client.
+        responses = await asyncio.gather(
+            client.get(ME_URL),
+            client.get(ME_URL, headers={"Authorization": "Token abcdef"}),
+            client.get(ME_URL, headers={"Authorization": "Bearer not.a.jwt"}),
+        )
+
+        assert [r.status_code for r in responses] == [401, 401, 401]
+
+    async def test_protected_endpoint_failure_with_expired_token(
+        self, client: AsyncClient, expired_token: str
+    ) -> None:
+        """An expired token is rejected with 401 by token validation."""
+        response = await client.get(
+            ME_URL, headers={"Authorization": f"Bearer {expired_token}"}
+        )
+
+        assert response.status_code == 401
+
+
+class TestAuthenticationFlow:
+    """End-to-end flows chaining signup, login and protected access."""
+
+    @pytest.mark.slow
+    async def test_complete_signup_login_access_flow(
+        self, client: AsyncClient, user_factory: Callable[..., dict[str, Any]]
+    ) -> None:
+        """Sign up, log in, and read the profile back with the token."""
+        user_data = user_factory(1)
+        signup = await client.post(SIGNUP_URL, json=user_data)
+        assert signup.status_code == 201
+        signup_data = signup.json()
+
+        login = await client.post(LOGIN_URL, data=_login_form(user_data))
+        assert login.status_code == 200
+        token = login.json()["access_token"]
+
+        me = await client.get(ME_URL, headers={"Authorization": f"Bearer {token}"})
+        assert me.status_code == 200
+        me_data = me.json()
+        assert me_data["id"] == signup_data["id"]
+        assert me_data["email"] == user_data["email"]
+
+    async def test_two_users_get_isolated_profiles(
+        self,
+        client: AsyncClient,
+        user_factory: Callable[..., dict[str, Any]],
+    ) -> None:
+        """Each user's token resolves /users/me to its own account only."""
+        user_data = user_factory(1)
+        user_data_2 = user_factory(2)
+        for data in (user_data, user_data_2):
+            signup = await client.post(SIGNUP_URL, json=data)
+            assert signup.status_code == 201
+
+        login_1 = await client.post(LOGIN_URL, data=_login_form(user_data))
+        login_2 = await client.post(LOGIN_URL, data=_login_form(user_data_2))
+
+        me_1 = await client.get(
+            ME_URL,
+            headers={"Authorization": f"Bearer {login_1.json()['access_token']}"},
+        )
+        me_2 = await client.get(
+            ME_URL,
+            headers={"Authorization": f"Bearer {login_2.json()['access_token']}"},
+        )
+
+        assert me_1.json()["email"] == user_data["email"]
+        assert me_2.json()["email"] == user_data_2["email"]
@@ -9,25 +9,36 @@ It includes fixtures for:
 - Dependency overrides for FastAPI
 """
 
-import asyncio
 import os
-from collections.abc import AsyncGenerator, Generator
+import tempfile
+from collections.abc import AsyncGenerator, Callable, Generator
+from contextvars import ContextVar
+from datetime import timedelta
+from functools import lru_cache
 from typing import Any
 
+import asyncpg
+import filelock
+import orjson
 import pytest
 import pytest_asyncio
-from httpx import ASGITransport, AsyncClient
+from httpx import ASGITransport, AsyncClient, Response
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.engine import URL
 from sqlalchemy.pool import NullPool
 
+from app.api.v1.endpoints import auth
+from app.core import security
 from app.core.config import get_settings
 from app.core.database import Base, get_db
+from app.core.security import create_access_token
 from app.main import app
+from app.models.user import User
 
 # Get settings
 settings = get_settings()
@@ -36,19 +47,173 @@ settings = get_settings()
 # When running tests locally (outside Docker), use localhost instead of 'db'
 TEST_POSTGRES_SERVER = os.getenv("TEST_POSTGRES_SERVER", "localhost")
 
+# pytest-xdist worker id ("gw0", "gw1", ...); "gw0" when running without -n.
+# Used to keep per-worker test data (e.g. signup emails) from colliding on
+# unique constraints when the suite is sharded across cores.
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
 
-# ==================== Event Loop Configuration ====================
-@pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+# Each xdist worker gets its own database so schema DDL and test data
+# never race across workers; serial runs use the "gw0" database.
+TEST_DB_NAME = f"{settings.POSTGRES_DB}_test_{WORKER_ID}"
+
+# Built once from components rather than string-replacing database_url;
+# substring surgery breaks if POSTGRES_DB happens to occur elsewhere in
+# the URL (e.g. inside the user name)
+TEST_DB_URL = URL.create(
+    drivername="postgresql+asyncpg",
+    username=settings.POSTGRES_USER,
+    password=settings.POSTGRES_PASSWORD,
+    host=TEST_POSTGRES_SERVER,
+    port=settings.POSTGRES_PORT,
+    database=TEST_DB_NAME,
+)
+
+
+# Template database holding the schema; worker databases are cloned from
+# it with CREATE DATABASE ... TEMPLATE, which copies files in one step
+# instead of replaying per-table DDL. Drop it after changing the models
+# so the next run rebuilds it.
+TEMPLATE_DB_NAME = f"{settings.POSTGRES_DB}_test_template"
+
+# Cross-process lock so only the first xdist worker builds the template
+_SCHEMA_LOCK_FILE = os.path.join(tempfile.gettempdir(), f"{TEMPLATE_DB_NAME}.lock")
+
+
+async def _connect_maintenance() -> asyncpg.Connection:
+    """Open a connection to the postgres maintenance database.
+
+    CREATE/DROP DATABASE cannot run inside the transaction SQLAlchemy
+    would open, so database bootstrap goes through asyncpg directly.
+    """
+    return await asyncpg.connect(
+        user=settings.POSTGRES_USER,
+        password=settings.POSTGRES_PASSWORD,
+        host=TEST_POSTGRES_SERVER,
+        port=settings.POSTGRES_PORT,
+        database="postgres",
+    )
+
+
+async def _ensure_template_database() -> None:
+    """Build the schema into the template database exactly once."""
+    with filelock.FileLock(_SCHEMA_LOCK_FILE):
+        conn = await _connect_maintenance()
+        try:
+            exists = await conn.fetchval(
+                "SELECT 1 FROM pg_database WHERE datname = $1", TEMPLATE_DB_NAME
+            )
+            if exists:
+                return
+            await conn.execute(f'CREATE DATABASE "{TEMPLATE_DB_NAME}"')
+        finally:
+            await conn.close()
+
+        template_engine = create_async_engine(
+            TEST_DB_URL.set(database=TEMPLATE_DB_NAME), poolclass=NullPool
+        )
+        async with template_engine.begin() as ddl_conn:
+            await ddl_conn.run_sync(Base.metadata.create_all)
+        await template_engine.dispose()
+
+        # Refuse ordinary connections so the template can't drift; cloning
+        # via TEMPLATE still works, like template0
+        conn = await _connect_maintenance()
+        try:
+            await conn.execute(
+                "UPDATE pg_database SET datallowconn = false WHERE datname = $1",
+                TEMPLATE_DB_NAME,
+            )
+        finally:
+            await conn.close()
+
+
+async def _create_worker_database(name: str) -> None:
+    """Clone a fresh worker database from the schema template."""
+    conn = await _connect_maintenance()
+    try:
+        await conn.execute(f'DROP DATABASE IF EXISTS "{name}"')
+        await conn.execute(
+            f'CREATE DATABASE "{name}" TEMPLATE "{TEMPLATE_DB_NAME}"'
+        )
+    finally:
+        await conn.close()
+
+
+# Fixtures whose presence in a test's closure means it needs Postgres
+_DB_FIXTURES = frozenset(
+    {"test_engine", "db_session", "client", "test_user", "auth_headers"}
+)
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Auto-mark DB-backed tests so `pytest -m "not integration"` skips them.
+
+    Any test whose fixture closure pulls in the engine, a session or the
+    HTTP client is an integration test. Deselecting them also skips all
+    database setup: test_engine is lazy and only runs when a selected
+    test requests it.
+
+    DB tests additionally get an xdist_group per module, so --dist
+    loadgroup routes a whole module to one worker instead of scattering
+    it across workers that would each rebuild the shared fixtures.
+    """
+    for item in items:
+        if _DB_FIXTURES.intersection(getattr(item, "fixturenames", ())):
+            item.add_marker(pytest.mark.integration)
+            module = getattr(item, "module", None)
+            if module is not None:
+                item.add_marker(pytest.mark.xdist_group(module.__name__))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _disable_rate_limiter() -> Generator[None, None, None]:
+    """Turn off slowapi rate limiting for the test session.
+
+    The auth endpoints allow 5 requests/minute per IP; the suite issues far
+    more than that from a single ASGI client and would otherwise see 429s.
+    The auth module decorates its routes with its own Limiter instance, so
+    both that one and the one on app.state must be disabled.
     """
-    Create an event loop for the entire test session.
-    
-    This is crucial for async tests to work properly.
-    Using session scope ensures all async tests share the same event loop.
+    app.state.limiter.enabled = False
+    auth.limiter.enabled = False
+    yield
+    app.state.limiter.enabled = True
+    auth.limiter.enabled = True
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _orjson_response_json() -> Generator[None, None, None]:
+    """Decode httpx response bodies with orjson for the test session.
+
+    Nearly every test calls response.json(); httpx parses with the stdlib
+    json module by default. The app already serializes with orjson, so
+    decoding with it is symmetric and several times faster on these small
+    payloads. orjson returns plain dicts/lists, so assertions are
+    unaffected.
+    """
+    stdlib_json = Response.json
+
+    def _orjson_json(self: Response, **_: Any) -> Any:
+        return orjson.loads(self.content)
+
+    Response.json = _orjson_json  # type: ignore[method-assign]
+    yield
+    Response.json = stdlib_json  # type: ignore[method-assign]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_bcrypt() -> Generator[None, None, None]:
+    """Drop the bcrypt work factor to the library minimum for tests.
+
+    Every signup/login pays a hash or verify; 4 rounds instead of the
+    production 12 makes that ~60x cheaper while producing hashes that
+    verify through the exact same code path. Production is untouched —
+    this only rebinds the module constant for the test process.
     """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+    production_rounds = security._BCRYPT_ROUNDS
+    security._BCRYPT_ROUNDS = 4
+    yield
+    security._BCRYPT_ROUNDS = production_rounds
 
 
 # ==================== Database Configuration ====================
@@ -56,149 +221,239 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
 async def test_engine() -> AsyncGenerator[AsyncEngine, None]:
     """
     Create a test-specific async database engine.
-    
-    This engine connects to a separate test database to avoid
-    polluting the development database.
-    
+
+    This engine connects to a separate per-worker test database to avoid
+    polluting the development database and to keep pytest-xdist workers
+    from racing each other on DDL or data.
+
     Configuration:
-    - Uses NullPool to prevent connection pooling issues in tests
-    - Database name is suffixed with '_test'
+    - Small connection pool, recycled across the whole suite: SAVEPOINT
+      isolation means tests can't leak transactional state through a
+      reused connection, so there is no reason to pay a fresh TCP+auth
+      handshake per test the way NullPool did
+    - Database name is suffixed with '_test_{worker id}'
     - Echo is disabled for cleaner test output
-    - Uses localhost for database host when running tests locally
-    """
-    # Build test database URL with localhost for local testing
-    # Replace 'db' (Docker service name) with 'localhost' or TEST_POSTGRES_SERVER
-    test_db_url = settings.database_url.replace(
-        f"@{settings.POSTGRES_SERVER}:",
-        f"@{TEST_POSTGRES_SERVER}:"
-    ).replace(
-        settings.POSTGRES_DB, 
-        f"{settings.POSTGRES_DB}_test"
-    )
-    
+    - Uses localhost (TEST_POSTGRES_SERVER) when running tests locally,
+      via the module-level TEST_DB_URL
+    """
+    await _ensure_template_database()
+    await _create_worker_database(TEST_DB_NAME)
+
     # Create async engine for test database
     engine = create_async_engine(
-        test_db_url,
+        TEST_DB_URL,
         echo=False,
-        poolclass=NullPool,  # Disable connection pooling for tests
+        pool_size=5,  # 5 per worker stays well under max_connections=100
+        max_overflow=0,
+        pool_pre_ping=True,
+        pool_recycle=300,
     )
-    
-    # Create all tables before tests
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
+
     yield engine
-    
-    # Drop all tables after tests
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-    
+
     await engine.dispose()
 
 
 @pytest_asyncio.fixture(scope="function")
-async def test_session_maker(
-    test_engine: AsyncEngine,
-) -> async_sessionmaker[AsyncSession]:
-    """
-    Create a session maker for test database.
-    
-    This fixture is function-scoped to ensure each test
-    gets a fresh session maker.
-    """
-    return async_sessionmaker(
-        bind=test_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
+async def db_session(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide a test database session isolated by an outer transaction.
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session(
-    test_session_maker: async_sessionmaker[AsyncSession],
-) -> AsyncGenerator[AsyncSession, None]:
-    """
-    Provide a test database session.
-    
-    This fixture:
-    - Creates a new session for each test
-    - Yields the session for test execution
-    - Automatically rolls back after each test to ensure isolation
-    - Closes the session properly
-    
-    This ensures each test runs in isolation with a clean database state.
-    """
-    async with test_session_maker() as session:
-        yield session
-        await session.rollback()
-        await session.close()
+    The session is bound to a dedicated connection whose outer transaction
+    is rolled back at teardown. With join_transaction_mode
+    "create_savepoint", every commit() issued by the test — or by endpoint
+    code running through the `client` fixture — only releases a SAVEPOINT
+    inside that outer transaction, so all writes vanish on rollback and no
+    per-test truncation or table recreation is needed.
+    """
+    async with test_engine.connect() as connection:
+        transaction = await connection.begin()
+        maker = async_sessionmaker(
+            bind=connection,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        async with maker() as session:
+            yield session
+        await transaction.rollback()
 
 
 # ==================== FastAPI Client Configuration ====================
+# Session for the currently running test. The override below is a single
+# module-level generator function; each test only sets the ContextVar
+# instead of allocating a fresh closure for FastAPI to call per request.
+_current_session: ContextVar[AsyncSession] = ContextVar("_current_session")
+
+
+async def _override_get_db() -> AsyncGenerator[AsyncSession, None]:
+    """get_db override yielding the running test's savepointed session."""
+    yield _current_session.get()
+
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _app_client() -> AsyncGenerator[AsyncClient, None]:
+    """
+    One AsyncClient over ASGI transport for the whole session.
+
+    Client construction and teardown are per-session; nothing about the
+    transport is test-specific. What varies per test is only the get_db
+    override, which the function-scoped `client` fixture swaps in.
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+        follow_redirects=True,
+    ) as session_client:
+        yield session_client
+
+
+@pytest_asyncio.fixture(scope="session", autouse=True)
+async def _warm_app(_app_client: AsyncClient) -> None:
+    """Build FastAPI's dependency and schema caches before the first test.
+
+    The first request through a cold app pays Dependant resolution and
+    Pydantic schema generation; fetching the OpenAPI document forces all
+    of it once so no individual test carries that cost. The app lifespan
+    is deliberately not run — it pings the development database with
+    retries, which tests must never do.
+    """
+    response = await _app_client.get("/openapi.json")
+    assert response.status_code == 200
+
+
 @pytest_asyncio.fixture(scope="function")
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """
-    Create an async HTTP client for testing FastAPI endpoints.
-    
-    This fixture:
-    - Overrides the get_db dependency to use the test database
-    - Creates an AsyncClient with ASGI transport
-    - Properly handles lifespan events
-    - Cleans up after each test
-    
+async def client(
+    _app_client: AsyncClient, db_session: AsyncSession
+) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Point the shared client's get_db at this test's session.
+
+    Overrides are popped (not cleared) at teardown so any overrides
+    installed by longer-lived fixtures survive.
+
     Usage in tests:
         async def test_example(client: AsyncClient):
             response = await client.get("/api/v1/endpoint")
             assert response.status_code == 200
     """
-    
-    # Override the get_db dependency to use test database
-    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
-        yield db_session
-    
-    app.dependency_overrides[get_db] = override_get_db
-    
-    # Create async client with ASGI transport
-    async with AsyncClient(
-        transport=ASGITransport(app=app),
-        base_url="http://test",
-        follow_redirects=True,
-    ) as test_client:
-        yield test_client
-    
-    # Clear dependency overrides after test
-    app.dependency_overrides.clear()
+
+    token = _current_session.set(db_session)
+    app.dependency_overrides[get_db] = _override_get_db
+    try:
+        yield _app_client
+    finally:
+        _current_session.reset(token)
+        app.dependency_overrides.pop(get_db, None)
 
 
 # ==================== Helper Fixtures ====================
-@pytest.fixture
-def user_data() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def user_factory(_fast_bcrypt: None) -> Callable[[int], dict[str, Any]]:
+    """
+    Build registration payloads for numbered test users.
+
+    user_factory(1), user_factory(2), ... return stable email/password/
+    full_name dicts plus a "hashed_password" whose bcrypt hash is cached
+    per password for the whole session, so direct-insert fixtures never
+    recompute it. Emails are deterministic but worker-suffixed: signups
+    made through the client roll back with the test, so they can't
+    collide across tests, only across concurrent workers.
+    """
+
+    @lru_cache(maxsize=None)
+    def _hash(password: str) -> str:
+        return security._hash_password(password)
+
+    def _make(i: int = 1) -> dict[str, Any]:
+        password = f"TestPassword{i}23!"
+        return {
+            "email": f"testuser{i}-{WORKER_ID}@example.com",
+            "password": password,
+            "full_name": f"Test User {i}",
+            "hashed_password": _hash(password),
+        }
+
+    return _make
+
+
+@pytest_asyncio.fixture
+async def test_user(
+    db_session: AsyncSession, user_factory: Callable[[int], dict[str, Any]]
+) -> dict[str, Any]:
     """
-    Provide sample user data for testing.
-    
+    Insert the standard test account inside the test's transaction.
+
+    Bypasses the signup endpoint: the row reuses the session-cached
+    bcrypt hash and disappears with the per-test rollback. Endpoints
+    exercised through the `client` fixture see the row because they run
+    on the same session.
+
     Returns:
-        Dictionary with valid user registration data
+        The credentials dict plus the generated "id"
+    """
+    credentials = user_factory(1)
+    user = User(
+        email=credentials["email"],
+        hashed_password=credentials["hashed_password"],
+        full_name=credentials["full_name"],
+    )
+    db_session.add(user)
+    await db_session.commit()
+    return credentials | {"id": user.id}
+
+
+@pytest.fixture(scope="session")
+def expired_token() -> str:
+    """
+    Sign one already-expired JWT for the whole session.
+
+    Token validation rejects it at decode time, before any user lookup,
+    so the subject does not need to exist.
     """
-    return {
-        "email": "testuser@example.com",
-        "password": "TestPassword123!",
-        "full_name": "Test User",
-    }
+    return create_access_token(subject=0, expires_delta=timedelta(seconds=-1))
 
 
 @pytest.fixture
-def user_data_2() -> dict[str, Any]:
+def valid_access_token(test_user: dict[str, Any]) -> str:
     """
-    Provide alternative user data for testing multiple users.
-    
-    Returns:
-        Dictionary with valid user registration data for a second user
+    Mint a valid JWT for the test account in-process.
+
+    Tests that only need *a* valid token shouldn't pay the login
+    endpoint's bcrypt verify; signing a token directly is the same thing
+    the endpoint would return.
+    """
+    return create_access_token(
+        subject=test_user["id"], expires_delta=timedelta(minutes=15)
+    )
+
+
+@pytest.fixture
+def fake_bcrypt(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Replace bcrypt verification with plain string comparison for one test.
+
+    Opt-in only: failure-path login tests assert on the handler's 401
+    behavior, not on the hasher, so they can skip the bcrypt verify
+    entirely — stored values are bcrypt digests, so plain == hashed is
+    always False for them. Happy-path tests keep the real hasher.
+    """
+    monkeypatch.setattr(
+        security, "_check_password", lambda plain, hashed: plain == hashed
+    )
+
+
+@pytest.fixture
+def auth_headers(valid_access_token: str) -> dict[str, str]:
     """
-    return {
-        "email": "testuser2@example.com",
-        "password": "AnotherPassword456!",
-        "full_name": "Test User Two",
-    }
+    Pre-built Authorization header for the module's registered account.
+
+    Centralizes the Bearer formatting so tests pass headers=auth_headers
+    instead of re-assembling the f-string at every call site.
+    """
+    return {"Authorization": f"Bearer {valid_access_token}"}
+
 
 
 # Add your custom fixtures here as needed